@@ -16,6 +16,7 @@ from .const import (
     # NEW:
     CONF_GATEWAY_PROFILE,
     DEFAULT_GATEWAY_PROFILE,
+    CONF_INPUT_AS_HOLDING,
     DEFAULT_SLAVE,
     DEFAULT_SCAN_INTERVAL,
     UNIT_MODEL_QV_MAX,
@@ -45,11 +46,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     model_cls = MODEL_REGISTRY[model_id]
     model = model_cls(qv_max=qv_max)
 
+    # The FC04 -> FC03 fallback only applies to the gateway it was detected on
+    input_as_holding_for = f"{host}:{port}:{gateway_profile}"
+
+    def _persist_input_as_holding() -> None:
+        # Remember the FC04 -> FC03 fallback so the next start skips the failed FC04 probes
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_INPUT_AS_HOLDING: input_as_holding_for}
+        )
+
     client = ModbusTcpClient(
         host=host,
         port=port,
         slave=int(slave),
         gateway_profile=gateway_profile,  # NEW
+        force_input_as_holding=entry.options.get(CONF_INPUT_AS_HOLDING) == input_as_holding_for,
+        on_input_as_holding=_persist_input_as_holding,
     )
     coordinator = SystemairCoordinator(
         hass,
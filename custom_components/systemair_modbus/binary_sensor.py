@@ -1,13 +1,46 @@
 """Binary sensor platform for Systemair Modbus."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    KEY_A_ALARM,
+    KEY_B_ALARM,
+    KEY_C_ALARM,
+    KEY_ECO_FUNCTION_ACTIVE,
+    KEY_EXTRACTOR_HOOD_SWITCH,
+    KEY_FILTER_ALARM,
+    KEY_FILTER_WARNING_ALARM,
+    KEY_FREE_COOLING_ACTIVE,
+    KEY_MODE_STATUS_REGISTER,
+    KEY_MODE_STATUS_TEXT,
+)
 from .entity import SystemairBaseEntity
 
+# Register values are almost always 0/1 (decoded as int or float), so answer those
+# with a single hash lookup and only parse anything else.
+# NOTE: 1 == 1.0 == True (and 0 == 0.0 == False) hash the same, so they are covered.
+_TRUTHY = frozenset((1, "1", "1.0"))
+_FALSY = frozenset((0, "0", "0.0", None, ""))
+
+
+def _flag_is_on(raw: Any, *, any_positive: bool = False) -> bool | None:
+    """Interpret a 0/1 register value (None/empty counts as off)."""
+    if raw in _TRUTHY:
+        return True
+    if raw in _FALSY:
+        return False
+    try:
+        val = int(float(raw))
+    except (TypeError, ValueError):
+        return None
+    return val > 0 if any_positive else val == 1
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
@@ -16,11 +49,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(
         [
             # User-facing alarm indicators (on/off)
-            BoolFromRegister(entry, coordinator, "a_alarm", "mdi:alert-circle"),
-            BoolFromRegister(entry, coordinator, "b_alarm", "mdi:alert-circle"),
-            BoolFromRegister(entry, coordinator, "c_alarm", "mdi:alert-circle"),
-            BoolFromRegister(entry, coordinator, "filter_alarm", "mdi:air-filter"),
-            BoolFromRegister(entry, coordinator, "filter_warning_alarm", "mdi:air-filter"),
+            BoolFromRegister(entry, coordinator, KEY_A_ALARM, "mdi:alert-circle"),
+            BoolFromRegister(entry, coordinator, KEY_B_ALARM, "mdi:alert-circle"),
+            BoolFromRegister(entry, coordinator, KEY_C_ALARM, "mdi:alert-circle"),
+            BoolFromRegister(entry, coordinator, KEY_FILTER_ALARM, "mdi:air-filter"),
+            BoolFromRegister(entry, coordinator, KEY_FILTER_WARNING_ALARM, "mdi:air-filter"),
             FreeCoolingActive(entry, coordinator),
             CookerHoodActive(entry, coordinator),
             EcoFunctionActive(entry, coordinator),
@@ -39,11 +72,7 @@ class BoolFromRegister(SystemairBaseEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        raw = self.coordinator.data.get(self._source_key)
-        try:
-            return int(float(raw or 0)) == 1
-        except (TypeError, ValueError):
-            return None
+        return _flag_is_on(self.coordinator.data.get(self._source_key))
 
 
 class FreeCoolingActive(SystemairBaseEntity, BinarySensorEntity):
@@ -55,11 +84,7 @@ class FreeCoolingActive(SystemairBaseEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        raw = self.coordinator.data.get("free_cooling_active")
-        try:
-            return int(float(raw or 0)) == 1
-        except (TypeError, ValueError):
-            return None
+        return _flag_is_on(self.coordinator.data.get(KEY_FREE_COOLING_ACTIVE))
 
 
 class CookerHoodActive(SystemairBaseEntity, BinarySensorEntity):
@@ -73,8 +98,8 @@ class CookerHoodActive(SystemairBaseEntity, BinarySensorEntity):
     def is_on(self) -> bool | None:
         data = self.coordinator.data
         try:
-            hood_switch = int(float(data.get("extractor_hood_pressure_switch_off_on") or 0))
-            mode_status = int(float(data.get("mode_status_register") or 0))
+            hood_switch = int(float(data.get(KEY_EXTRACTOR_HOOD_SWITCH) or 0))
+            mode_status = int(float(data.get(KEY_MODE_STATUS_REGISTER) or 0))
             return hood_switch == 1 or mode_status == 7
         except (TypeError, ValueError):
             return None
@@ -89,12 +114,8 @@ class EcoFunctionActive(SystemairBaseEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        raw = self.coordinator.data.get("eco_function_active")
-        try:
-            # Some units may report >0 when active.
-            return int(float(raw or 0)) > 0
-        except (TypeError, ValueError):
-            return None
+        # Some units may report >0 when active.
+        return _flag_is_on(self.coordinator.data.get(KEY_ECO_FUNCTION_ACTIVE), any_positive=True)
 
 
 class PressureGuardActive(SystemairBaseEntity, BinarySensorEntity):
@@ -109,11 +130,11 @@ class PressureGuardActive(SystemairBaseEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         # Prefer derived mode_status_text if available.
-        val = self.coordinator.data.get("mode_status_text")
+        val = self.coordinator.data.get(KEY_MODE_STATUS_TEXT)
         if val is not None:
             return str(val) == "pressure_guard"
         # Fallback to raw mode status register.
-        raw = self.coordinator.data.get("mode_status_register")
+        raw = self.coordinator.data.get(KEY_MODE_STATUS_REGISTER)
         try:
             return int(float(raw or 0)) == 12
         except (TypeError, ValueError):
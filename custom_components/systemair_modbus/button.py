@@ -150,7 +150,6 @@ class FilterReplacedButton(_BaseActionButton):
     _attr_icon = "mdi:air-filter"
 
     _ADDR_FILTER_REPLACEMENT_TIME_L = 7001
-    _ADDR_FILTER_REPLACEMENT_TIME_H = 7002
 
     def __init__(self, entry: ConfigEntry, coordinator, client, model) -> None:
         super().__init__(entry, coordinator, client, model)
@@ -158,9 +157,8 @@ class FilterReplacedButton(_BaseActionButton):
 
     async def async_press(self) -> None:
         try:
-            # Reset counter to 0 (low/high)
-            await self._client.write_register(self._ADDR_FILTER_REPLACEMENT_TIME_L, 0)
-            await self._client.write_register(self._ADDR_FILTER_REPLACEMENT_TIME_H, 0)
+            # Reset counter to 0 (low/high) in one request
+            await self._client.write_registers(self._ADDR_FILTER_REPLACEMENT_TIME_L, [0, 0])
         except Exception as err:
             _LOGGER.warning("Filter replaced failed: %s", err)
             raise HomeAssistantError(f"Filter replaced failed: {err}") from err
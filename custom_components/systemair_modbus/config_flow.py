@@ -1,10 +1,9 @@
 """Config flow for Systemair Modbus."""
 from __future__ import annotations
 
-import logging
 import asyncio
+import logging
 
-import async_timeout
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -20,29 +19,52 @@ from .const import (
     CONF_MODEL,
     CONF_UNIT_MODEL,
     CONF_GATEWAY_PROFILE,
+    CONF_INCLUDE_DIAGNOSTIC,
+    CONF_INPUT_AS_HOLDING,
     GATEWAY_PROFILE_GENERIC,
     GATEWAY_PROFILE_SAVE_CONNECT,
     DEFAULT_GATEWAY_PROFILE,
+    DEFAULT_INCLUDE_DIAGNOSTIC,
     DEFAULT_PORT,
     DEFAULT_SLAVE,
     DEFAULT_SCAN_INTERVAL,
     SUPPORTED_MODELS,
     UNIT_MODEL_QV_MAX,
 )
-from .modbus import ModbusTcpClient
+from .modbus import DEFAULT_TIMEOUT_S, ModbusTcpClient
 from .models import MODEL_REGISTRY
 
 _LOGGER = logging.getLogger(__name__)
 
-
-async def _tcp_probe(host: str, port: int, timeout_s: float = 3.0) -> None:
-    """Fast TCP reachability check (network/VLAN/firewall vs Modbus issues)."""
-    _LOGGER.debug("TCP probe start: %s:%s (timeout=%ss)", host, port, timeout_s)
-    conn = asyncio.open_connection(host, port)
-    reader, writer = await asyncio.wait_for(conn, timeout=timeout_s)
-    writer.close()
-    await writer.wait_closed()
-    _LOGGER.debug("TCP probe OK: %s:%s", host, port)
+# Per-request pymodbus timeout used while validating generic gateways, so an
+# unreachable/misconfigured host fails fast instead of waiting the full runtime timeout.
+# SAVE Connect keeps the normal timeout (it can be slow to answer).
+_VALIDATION_REQUEST_TIMEOUT_S = 3.0
+_VALIDATION_CONNECT_TIMEOUT_S = 3.0
+
+_GATEWAY_PROFILE_OPTIONS = {
+    GATEWAY_PROFILE_GENERIC: "Generic Modbus gateway (EW11, etc.)",
+    GATEWAY_PROFILE_SAVE_CONNECT: "Systemair SAVE Connect (safe mode)",
+}
+
+# Validators shared by both flows; only the options flow defaults vary per entry.
+_GATEWAY_PROFILE_VALIDATOR = vol.In(_GATEWAY_PROFILE_OPTIONS)
+_OPTIONS_SLAVE_VALIDATOR = vol.All(vol.Coerce(int), vol.In([1, 2]))
+
+# The user step form is fully static, so it is built once at import.
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MODEL, default=SUPPORTED_MODELS[0]): vol.In(
+            {mid: MODEL_REGISTRY[mid].model_name for mid in SUPPORTED_MODELS}
+        ),
+        vol.Required(CONF_UNIT_MODEL, default="Generic (legacy x3)"): vol.In(list(UNIT_MODEL_QV_MAX.keys())),
+        vol.Required(CONF_GATEWAY_PROFILE, default=DEFAULT_GATEWAY_PROFILE): _GATEWAY_PROFILE_VALIDATOR,
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.Coerce(int),
+        vol.Required(CONF_SLAVE, default=DEFAULT_SLAVE): vol.Coerce(int),
+        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(int),
+    }
+)
 
 
 async def _async_validate_connection(
@@ -56,9 +78,21 @@ async def _async_validate_connection(
     """Validate that we can reach the device and read at least one register."""
     model_cls = MODEL_REGISTRY[model_id]
     # Use a single, stable holding register to keep config flow fast.
-    test_reg = model_cls.REGISTERS[0].__dict__
-
-    client = ModbusTcpClient(host=host, port=port, slave=slave, gateway_profile=gateway_profile)
+    test_reg = model_cls.REGISTERS[0]
+
+    client = ModbusTcpClient(
+        host=host,
+        port=port,
+        slave=slave,
+        gateway_profile=gateway_profile,
+        timeout_s=(
+            DEFAULT_TIMEOUT_S
+            if gateway_profile == GATEWAY_PROFILE_SAVE_CONNECT
+            else _VALIDATION_REQUEST_TIMEOUT_S
+        ),
+        # Doubles as the TCP reachability check (network/VLAN/firewall vs Modbus issues)
+        connect_timeout_s=_VALIDATION_CONNECT_TIMEOUT_S,
+    )
 
     # Keep default at 10s, but allow more room for SAVE Connect safe mode
     timeout_s = 10
@@ -66,12 +100,12 @@ async def _async_validate_connection(
         timeout_s = 25
 
     try:
-        async with async_timeout.timeout(timeout_s):
+        async with asyncio.timeout(timeout_s):
             result = await client.read_register_map([test_reg])
         # Some gateways can respond but still return empty/invalid data;
-        # treat that as a failed connect for UX.
+        # treat that as a failed connect for UX. Not a ConnectionError: TCP worked.
         if not result:
-            raise ConnectionError("Empty modbus response")
+            raise ValueError("Empty modbus response")
     finally:
         await client.async_close()
 
@@ -84,10 +118,11 @@ class SystemairModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             model_id = user_input[CONF_MODEL]
-            host = str(user_input[CONF_HOST]).strip()
-            port = int(user_input[CONF_PORT])
-            slave = int(user_input[CONF_SLAVE])
-            scan_interval = int(user_input[CONF_SCAN_INTERVAL])
+            # The schema already coerced the numbers; only the host needs trimming.
+            host = user_input[CONF_HOST].strip()
+            port = user_input[CONF_PORT]
+            slave = user_input[CONF_SLAVE]
+            scan_interval = user_input[CONF_SCAN_INTERVAL]
             unit_model = user_input[CONF_UNIT_MODEL]
             gateway_profile = user_input[CONF_GATEWAY_PROFILE]
 
@@ -96,10 +131,7 @@ class SystemairModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             try:
-                # First: is TCP even reachable from HA?
-                await _tcp_probe(host, port, timeout_s=3.0)
-
-                # Then: can we do at least one Modbus read using the selected profile?
+                # Connect (bounded) + at least one Modbus read using the selected profile
                 await _async_validate_connection(
                     host=host,
                     port=port,
@@ -108,7 +140,12 @@ class SystemairModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     gateway_profile=gateway_profile,
                 )
             except Exception as err:  # noqa: BLE001
-                _LOGGER.debug("Cannot connect to Systemair Modbus device: %s", err, exc_info=True)
+                if isinstance(err, TimeoutError):
+                    _LOGGER.debug("Timed out talking to Systemair Modbus device %s:%s", host, port, exc_info=True)
+                elif isinstance(err, ConnectionError):
+                    _LOGGER.debug("TCP connection to %s:%s failed: %s", host, port, err, exc_info=True)
+                else:
+                    _LOGGER.debug("Cannot connect to Systemair Modbus device: %s", err, exc_info=True)
                 errors["base"] = "cannot_connect"
             else:
                 model_name = MODEL_REGISTRY[model_id].model_name
@@ -128,26 +165,7 @@ class SystemairModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-        model_options = {mid: MODEL_REGISTRY[mid].model_name for mid in SUPPORTED_MODELS}
-
-        gateway_profile_options = {
-            GATEWAY_PROFILE_GENERIC: "Generic Modbus gateway (EW11, etc.)",
-            GATEWAY_PROFILE_SAVE_CONNECT: "Systemair SAVE Connect (safe mode)",
-        }
-
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_MODEL, default=SUPPORTED_MODELS[0]): vol.In(model_options),
-                vol.Required(CONF_UNIT_MODEL, default="Generic (legacy x3)"): vol.In(list(UNIT_MODEL_QV_MAX.keys())),
-                vol.Required(CONF_GATEWAY_PROFILE, default=DEFAULT_GATEWAY_PROFILE): vol.In(gateway_profile_options),
-                vol.Required(CONF_HOST): str,
-                vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.Coerce(int),
-                vol.Required(CONF_SLAVE, default=DEFAULT_SLAVE): vol.Coerce(int),
-                vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(int),
-            }
-        )
-
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA, errors=errors)
 
     @staticmethod
     @callback
@@ -161,8 +179,19 @@ class SystemairOptionsFlow(config_entries.OptionsFlow):
         self._config_entry = config_entry
 
     async def async_step_init(self, user_input=None) -> FlowResult:
+        current_profile = self._config_entry.options.get(
+            CONF_GATEWAY_PROFILE,
+            self._config_entry.data.get(CONF_GATEWAY_PROFILE, DEFAULT_GATEWAY_PROFILE),
+        )
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # Merge, so values stored by the integration itself (e.g. the detected
+            # FC03 fallback) survive an options change.
+            options = {**self._config_entry.options, **user_input}
+            # ...unless the gateway profile changed: probe FC04 again on the new profile.
+            if user_input[CONF_GATEWAY_PROFILE] != current_profile:
+                options.pop(CONF_INPUT_AS_HOLDING, None)
+            return self.async_create_entry(title="", data=options)
 
         current_scan = self._config_entry.options.get(
             CONF_SCAN_INTERVAL,
@@ -172,24 +201,16 @@ class SystemairOptionsFlow(config_entries.OptionsFlow):
             CONF_SLAVE,
             self._config_entry.data.get(CONF_SLAVE, DEFAULT_SLAVE),
         )
-        current_profile = self._config_entry.options.get(
-            CONF_GATEWAY_PROFILE,
-            self._config_entry.data.get(CONF_GATEWAY_PROFILE, DEFAULT_GATEWAY_PROFILE),
+        current_include_diagnostic = self._config_entry.options.get(
+            CONF_INCLUDE_DIAGNOSTIC, DEFAULT_INCLUDE_DIAGNOSTIC
         )
 
-        gateway_profile_options = {
-            GATEWAY_PROFILE_GENERIC: "Generic Modbus gateway (EW11, etc.)",
-            GATEWAY_PROFILE_SAVE_CONNECT: "Systemair SAVE Connect (safe mode)",
-        }
-
         schema = vol.Schema(
             {
-                vol.Required(CONF_GATEWAY_PROFILE, default=current_profile): vol.In(gateway_profile_options),
+                vol.Required(CONF_GATEWAY_PROFILE, default=current_profile): _GATEWAY_PROFILE_VALIDATOR,
                 vol.Required(CONF_SCAN_INTERVAL, default=current_scan): vol.Coerce(int),
-                vol.Required(CONF_SLAVE, default=current_slave): vol.All(
-                    vol.Coerce(int),
-                    vol.In([1, 2]),
-                ),
+                vol.Required(CONF_SLAVE, default=current_slave): _OPTIONS_SLAVE_VALIDATOR,
+                vol.Required(CONF_INCLUDE_DIAGNOSTIC, default=current_include_diagnostic): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Constants for Systemair Modbus integration."""
 from __future__ import annotations
 
+import sys
+from typing import Final
+
 DOMAIN = "systemair_modbus"
 
 CONF_HOST = "host"
@@ -16,6 +19,15 @@ GATEWAY_PROFILE_GENERIC = "generic"
 GATEWAY_PROFILE_SAVE_CONNECT = "save_connect"
 DEFAULT_GATEWAY_PROFILE = GATEWAY_PROFILE_GENERIC  # evt. bytt til SAVE_CONNECT hvis du vil "safe by default"
 
+# Set in options once the gateway has rejected FC04 (input registers are then read via FC03).
+# Stores the "host:port:gateway_profile" it was detected on; any other connection probes FC04 again.
+CONF_INPUT_AS_HOLDING = "input_as_holding"
+
+# Create the raw register sensors that are hidden by default (diagnostic). Turning this off
+# keeps only the default-enabled raw sensors, the derived sensors and the calculated one.
+CONF_INCLUDE_DIAGNOSTIC = "include_diagnostic"
+DEFAULT_INCLUDE_DIAGNOSTIC = True
+
 DEFAULT_PORT = 502
 DEFAULT_SLAVE = 1
 DEFAULT_SCAN_INTERVAL = 10  # seconds
@@ -48,3 +60,16 @@ UNIT_MODEL_QV_MAX: dict[str, int | None] = {
     "VTR 500": 572,
     "VTR 700": 951,
 }
+
+# Coordinator data keys read by the binary sensors on every update.
+# Interned so every lookup site shares one string object (and its cached hash).
+KEY_A_ALARM: Final[str] = sys.intern("a_alarm")
+KEY_B_ALARM: Final[str] = sys.intern("b_alarm")
+KEY_C_ALARM: Final[str] = sys.intern("c_alarm")
+KEY_FILTER_ALARM: Final[str] = sys.intern("filter_alarm")
+KEY_FILTER_WARNING_ALARM: Final[str] = sys.intern("filter_warning_alarm")
+KEY_FREE_COOLING_ACTIVE: Final[str] = sys.intern("free_cooling_active")
+KEY_EXTRACTOR_HOOD_SWITCH: Final[str] = sys.intern("extractor_hood_pressure_switch_off_on")
+KEY_ECO_FUNCTION_ACTIVE: Final[str] = sys.intern("eco_function_active")
+KEY_MODE_STATUS_REGISTER: Final[str] = sys.intern("mode_status_register")
+KEY_MODE_STATUS_TEXT: Final[str] = sys.intern("mode_status_text")
@@ -6,7 +6,8 @@ from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 from .modbus import ModbusTcpClient
 
@@ -17,6 +18,8 @@ class SystemairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, *, name: str, client: ModbusTcpClient, model, scan_interval_s: int) -> None:
         self.client = client
         self.model = model
+        # Passed as-is: the client caches its read plan per register map object.
+        self._register_defs = model.REGISTERS
 
         super().__init__(
             hass,
@@ -24,10 +27,15 @@ class SystemairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=name,
             update_method=self._async_update_data,
             update_interval=timedelta(seconds=scan_interval_s),
+            # Most polls return the same values; only notify entities when something changed.
+            always_update=False,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        base = await self.client.read_register_map([r.__dict__ for r in self.model.REGISTERS])
+        try:
+            base = await self.client.read_register_map(self._register_defs)
+        except (ConnectionException, ModbusIOException, ConnectionError, TimeoutError) as err:
+            raise UpdateFailed(f"Modbus connection to {self.client.host}:{self.client.port} failed: {err}") from err
         derived = self.model.compute_derived(base)
         base.update(derived)
         return base
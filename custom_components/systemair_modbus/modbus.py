@@ -10,19 +10,25 @@ Key points:
 
 Profiles:
 - generic: aggressive batching, can bridge holes, tries FC04 for input registers
-- save_connect: safe mode (uint32-safe batch=2), no hole bridging, forces FC03 for "input"
-               + serial request queue + pacing + retries/backoff (SAVE Connect robustness)
+- save_connect: safe mode (batches of up to 64, uint32 pairs kept together), no hole bridging, forces FC03 for "input"
+               + serialized requests + pacing + retries/backoff (SAVE Connect robustness)
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Awaitable
+from operator import itemgetter
+from typing import Any, Callable, Awaitable, Sequence
 import logging
 import asyncio
 import inspect
+import random
+import socket
+import struct
+import time
 
 from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,100 +38,358 @@ DEFAULT_TIMEOUT_S = 5
 DEFAULT_CONNECT_DELAY_S = 10
 DEFAULT_MESSAGE_WAIT_S = 0.03  # 30 ms (after each request)
 
+# Hard upper bound per read on top of pymodbus' own timeout and retries, so one hung
+# request can't stall the poll. Both pymodbus' "no response" and our cut-off surface as a
+# TimeoutError (see _timed_read) and go through retry/abort.
+REQUEST_TIMEOUT_GRACE_S = 0.5
+
+# Adaptive message wait (AIMD): start at the profile's message_wait_s, add a step after a
+# request only succeeds following a busy/failed one, and step back down after a run of
+# clean requests. Responsive gateways thus pay no dead time between requests.
+MESSAGE_WAIT_STEP_UP_S = 0.02
+MESSAGE_WAIT_STEP_DOWN_S = 0.01
+MESSAGE_WAIT_MAX_S = 0.08
+MESSAGE_WAIT_DECREASE_AFTER = 50
+
+# TCP keepalive on the Modbus socket, so NAT/gateway idle timeouts don't silently drop
+# the session between polls (which would cost a reconnect, plus the connect delay).
+TCP_KEEPALIVE_IDLE_S = 30
+TCP_KEEPALIVE_INTERVAL_S = 10
+TCP_KEEPALIVE_COUNT = 3
+
 # Save Connect safe-mode extras
 DEFAULT_SAVE_CONNECT_PACING_S = 0.10  # 100 ms between requests
 DEFAULT_SAVE_CONNECT_RETRIES = 5
 DEFAULT_SAVE_CONNECT_BACKOFF_BASE_S = 0.20  # exponential backoff base
+BACKOFF_MAX_EXPONENT = 5
+BACKOFF_JITTER = 0.5  # up to +50% random extra delay per retry
+
+# Modbus FC03/FC04 can return at most 125 registers per request.
+MAX_BATCH_REGS = 125
+
+# Above this many registers per poll, decoding is moved to a worker thread.
+DECODE_IN_THREAD_MIN_REGS = 200
 
 # Profiles / gateway strategies
 GATEWAY_PROFILE_GENERIC = "generic"
 GATEWAY_PROFILE_SAVE_CONNECT = "save_connect"
 
-PROFILE_CONFIG: dict[str, dict[str, Any]] = {
-    GATEWAY_PROFILE_GENERIC: {
-        "max_batch_size": None,           # allow large reads
-        "bridge_holes": True,             # allow grouping across holes
-        "force_input_as_holding": False,  # try FC04 normally
+
+@dataclass(frozen=True, slots=True)
+class ProfileConfig:
+    """Request strategy for one gateway profile."""
+
+    max_batch_size: int | None  # None: up to MAX_BATCH_REGS per read
+    bridge_holes: bool  # allow grouping across holes
+    max_gap: int  # max unused registers bridged in one read
+    force_input_as_holding: bool  # read "input" registers with FC03 instead of FC04
+    message_wait_s: float  # floor for the adaptive wait after each request
+    serialize: bool  # one request at a time under io_lock, with retries/reconnects
+    pacing_s: float  # extra gap between serialized requests
+    retries: int
+    backoff_base_s: float
+    connect_delay_s: float  # pause after (re)connecting before the first request
+
+
+PROFILE_CONFIG: dict[str, ProfileConfig] = {
+    GATEWAY_PROFILE_GENERIC: ProfileConfig(
+        max_batch_size=None,            # allow large reads
+        bridge_holes=True,              # allow grouping across holes
+        max_gap=8,
+        force_input_as_holding=False,   # try FC04 normally
+        message_wait_s=0.0,             # adaptive, only grows if the gateway struggles
 
         # robustness features OFF for generic
-        "use_queue": False,
-        "pacing_s": 0.0,
-        "retries": 3,
-        "backoff_base_s": 0.0,
-
-        # NEW: profile-controlled connect delay (avoid slowing down generic gateways)
-        "connect_delay_s": 0.0,
-    },
-    GATEWAY_PROFILE_SAVE_CONNECT: {
-        "max_batch_size": 2,              # uint32-safe, very conservative
-        "bridge_holes": False,            # only strictly contiguous
-        "force_input_as_holding": True,   # avoid FC04 entirely
+        serialize=False,
+        pacing_s=0.0,
+        retries=3,
+        backoff_base_s=0.0,
+
+        # profile-controlled connect delay (avoid slowing down generic gateways)
+        connect_delay_s=0.0,
+    ),
+    GATEWAY_PROFILE_SAVE_CONNECT: ProfileConfig(
+        max_batch_size=64,              # conservative; uint32 pairs are never split
+        bridge_holes=False,             # only strictly contiguous
+        max_gap=0,                      # never read undefined registers
+        force_input_as_holding=True,    # avoid FC04 entirely
+        message_wait_s=DEFAULT_MESSAGE_WAIT_S,
 
         # robustness features ON for Save Connect
-        "use_queue": True,
-        "pacing_s": DEFAULT_SAVE_CONNECT_PACING_S,
-        "retries": DEFAULT_SAVE_CONNECT_RETRIES,
-        "backoff_base_s": DEFAULT_SAVE_CONNECT_BACKOFF_BASE_S,
-
-        # NEW: keep conservative connect delay for save_connect safe mode
-        "connect_delay_s": float(DEFAULT_CONNECT_DELAY_S),
-    },
+        serialize=True,
+        pacing_s=DEFAULT_SAVE_CONNECT_PACING_S,
+        retries=DEFAULT_SAVE_CONNECT_RETRIES,
+        backoff_base_s=DEFAULT_SAVE_CONNECT_BACKOFF_BASE_S,
+
+        # keep conservative connect delay for save_connect safe mode
+        connect_delay_s=float(DEFAULT_CONNECT_DELAY_S),
+    ),
 }
 
 
+# Slave/unit id keyword names used by the different pymodbus versions.
+_SLAVE_KWS: tuple[str, ...] = ("slave", "unit", "device_id", "unit_id")
+
+# pymodbus read call shapes, in the order they are tried: (fn, address, count, slave)
+_READ_CALLS: tuple[Callable[..., Awaitable[Any]], ...] = (
+    # 1) Preferred: keyword-only count supported + explicit slave/unit id
+    *((lambda fn, a, c, s, kw=kw: fn(a, count=c, **{kw: s})) for kw in _SLAVE_KWS),
+    # 2) Next: keyword-only count supported (no slave/unit)
+    lambda fn, a, c, s: fn(a, count=c),
+    # 3) Positional (address, count) with explicit slave/unit id via keywords
+    *((lambda fn, a, c, s, kw=kw: fn(a, c, **{kw: s})) for kw in _SLAVE_KWS),
+    # 4) Some environments accept positional (address, count)
+    lambda fn, a, c, s: fn(a, c),
+    # 5) Last resort: positional including slave (rare)
+    lambda fn, a, c, s: fn(a, c, s),
+)
+
+# pymodbus write_register/write_registers call shapes, in the order they are tried:
+# (fn, address, value(s), slave)
+_WRITE_CALLS: tuple[Callable[..., Awaitable[Any]], ...] = (
+    # 1) Preferred: explicit slave/unit id
+    *((lambda fn, a, v, s, kw=kw: fn(a, v, **{kw: s})) for kw in _SLAVE_KWS),
+    # 2) Simple (address, value)
+    lambda fn, a, v, s: fn(a, v),
+    # 3) Last resort: positional including slave
+    lambda fn, a, v, s: fn(a, v, s),
+)
+
+# Slave/unit keyword used by each keyword-passing call shape, read and write alike
+_SLAVE_KW_BY_CALL: dict[Callable[..., Awaitable[Any]], str] = {
+    **{_READ_CALLS[i]: kw for i, kw in enumerate(_SLAVE_KWS)},
+    **{_READ_CALLS[len(_SLAVE_KWS) + 1 + i]: kw for i, kw in enumerate(_SLAVE_KWS)},
+    **{_WRITE_CALLS[i]: kw for i, kw in enumerate(_SLAVE_KWS)},
+}
+
+
+# Modbus exception codes we act on
+EXC_ILLEGAL_FUNCTION = 0x01
+EXC_ILLEGAL_DATA_ADDRESS = 0x02
+EXC_DEVICE_BUSY = 0x06
+EXC_GATEWAY_TARGET_FAILED = 0x0B
+_BUSY_EXCEPTION_CODES = frozenset((EXC_DEVICE_BUSY, EXC_GATEWAY_TARGET_FAILED))
+
+# Errors that mean the connection itself is gone (as opposed to a Modbus exception
+# response for one range). Retrying the remaining ranges would only stack timeouts.
+_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionException,
+    ConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+def _is_connection_error(exc: BaseException | None) -> bool:
+    """True if exc means the gateway stopped answering, not that one request was rejected.
+
+    pymodbus 3.11 reports an unanswered request ("No response received ...") and one cut
+    short by our own timeout ("Request cancelled outside pymodbus.") as ModbusIOException.
+    """
+    if isinstance(exc, _CONNECTION_ERRORS):
+        return True
+    if isinstance(exc, ModbusIOException):
+        msg = str(exc).lower()
+        return "no response" in msg or "cancelled" in msg
+    return False
+
+# Precompiled unpackers per data type, applied to the response packed as *little-endian*
+# 16-bit words. Systemair uses L/H register pairs (low word first), so with every word
+# little-endian a uint32 is a plain "<I" and needs no word swap.
+_UNPACKERS: dict[str, Callable[[Any, int], tuple[int, ...]]] = {
+    "int16": struct.Struct("<h").unpack_from,
+    "uint16": struct.Struct("<H").unpack_from,
+    "uint32": struct.Struct("<I").unpack_from,
+}
+
+# Registers occupied per data type (anything not listed is a single register)
+_REG_LEN: dict[str, int] = {"int16": 1, "uint16": 1, "uint32": 2}
+
+# Decoder kind per plan entry, classified once when the plan is built
+_DECODE_UINT16_RAW = 0  # uint16, scale 1, offset 0, no rounding: index the response directly
+_DECODE_RAW = 1  # int16/uint32 without scaling: unpack only
+_DECODE_SCALED = 2  # unpack, then scale/offset/round
+_DECODE_GENERIC = 3  # unknown data type: per-register fallback
+
+
+def _decoder_kind(data_type: str, scale: float, offset: float, precision: int | None) -> int:
+    if data_type not in _UNPACKERS:
+        return _DECODE_GENERIC
+    if scale != 1.0 or offset != 0.0 or precision is not None:
+        return _DECODE_SCALED
+    return _DECODE_UINT16_RAW if data_type == "uint16" else _DECODE_RAW
+
+
+# One planned read:
+# (start, count, [(key, idx, data_type, kind, unpack, scale, offset, precision), ...])
+# where idx is the position of the value within the response and kind is a _DECODE_* value.
+_ReadRange = tuple[
+    int,
+    int,
+    list[tuple[Any, int, str, int, Callable[[Any, int], tuple[int, ...]] | None, float, float, int | None]],
+]
+
+
+def _signature_params(fn: Any) -> frozenset[str]:
+    """Named parameters of fn, or an empty set if its signature can't be introspected."""
+    if fn is None:
+        return frozenset()
+    try:
+        return frozenset(inspect.signature(fn).parameters)
+    except (TypeError, ValueError):
+        return frozenset()
+
+
+def _enable_tcp_keepalive(client: AsyncModbusTcpClient) -> None:
+    """Best-effort SO_KEEPALIVE on the client's socket (transport location varies by pymodbus version)."""
+    transport = getattr(client, "transport", None) or getattr(getattr(client, "ctx", None), "transport", None)
+    if transport is None:
+        return
+    try:
+        sock = transport.get_extra_info("socket")
+        if sock is None:
+            return
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Tuning knobs are platform specific (e.g. no TCP_KEEPIDLE on macOS)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE_S)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL_S)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+    except Exception as e:  # noqa: BLE001
+        _LOGGER.debug("Could not enable TCP keepalive: %s", e)
+
+
 async def _safe_client_close(client: AsyncModbusTcpClient | None) -> None:
     """Close pymodbus client in a way that works across versions (sync or async close)."""
     if client is None:
         return
     try:
-        res = client.close()
-        if inspect.isawaitable(res):
-            await res
+        # pymodbus 3.x close() is synchronous; only await when a version makes it a coroutine.
+        if inspect.iscoroutinefunction(client.close):
+            await client.close()
+        else:
+            client.close()
     except Exception:  # noqa: BLE001
         # Best-effort close; some gateways/versions can throw during shutdown.
         pass
 
 
-@dataclass
 class ModbusTcpClient:
-    host: str
-    port: int
-    slave: int
-    gateway_profile: str = GATEWAY_PROFILE_GENERIC
+    # Slotted: no per-instance __dict__, and attribute access on the hot read path
+    # (self.slave, self._client, ...) is a fixed-offset lookup.
+    __slots__ = (
+        "host",
+        "port",
+        "slave",
+        "gateway_profile",
+        "timeout_s",
+        "connect_timeout_s",
+        "force_input_as_holding",
+        "on_input_as_holding",
+        "_client",
+        "_max_batch_size",
+        "_bridge_holes",
+        "_max_gap",
+        "_force_input_as_holding",
+        "_serialize",
+        "_pacing_s",
+        "_retries",
+        "_client_retries",
+        "_read_timeout_s",
+        "_backoff_base_s",
+        "_connect_delay_s",
+        "_min_msg_delay",
+        "_inter_msg_delay",
+        "_msg_ok_streak",
+        "_msg_recovering",
+        "_next_request_ts",
+        "_connected_once",
+        "_io_lock",
+        "_plan_cache",
+        "_read_invoker",
+        "_write_invoker",
+        "_multi_write_supported",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        slave: int,
+        gateway_profile: str = GATEWAY_PROFILE_GENERIC,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        # Optional hard limit for establishing the TCP connection (used by the config flow)
+        connect_timeout_s: float | None = None,
+        # Seed for the FC04 -> FC03 fallback (persisted from an earlier detection)
+        force_input_as_holding: bool = False,
+        # Called once when the gateway rejects FC04 as an illegal function, so the caller can persist it
+        on_input_as_holding: Callable[[], None] | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.slave = slave
+        self.gateway_profile = gateway_profile
+        self.timeout_s = timeout_s
+        self.connect_timeout_s = connect_timeout_s
+        self.force_input_as_holding = force_input_as_holding
+        self.on_input_as_holding = on_input_as_holding
 
-    def __post_init__(self) -> None:
         self._client: AsyncModbusTcpClient | None = None
 
         profile = PROFILE_CONFIG.get(self.gateway_profile, PROFILE_CONFIG[GATEWAY_PROFILE_GENERIC])
-        self._max_batch_size: int | None = profile["max_batch_size"]
-        self._bridge_holes: bool = bool(profile["bridge_holes"])
-        self._force_input_as_holding: bool = bool(profile["force_input_as_holding"])
+        self._max_batch_size: int | None = profile.max_batch_size
+        self._bridge_holes: bool = profile.bridge_holes
+        self._max_gap: int = profile.max_gap
+        self._force_input_as_holding: bool = profile.force_input_as_holding or bool(
+            self.force_input_as_holding
+        )
+
+        self._serialize: bool = profile.serialize
+        self._pacing_s: float = profile.pacing_s
+        self._retries: int = profile.retries
+        self._backoff_base_s: float = profile.backoff_base_s
+        # Retries live in one place: serialized profiles retry (with backoff/reconnect) in
+        # _with_retries, the others let pymodbus retry. The read bound covers every attempt.
+        self._client_retries: int = 0 if self._serialize else self._retries
+        self._read_timeout_s: float = (
+            self.timeout_s * (self._client_retries + 1) + REQUEST_TIMEOUT_GRACE_S
+        )
 
-        self._use_queue: bool = bool(profile.get("use_queue", False))
-        self._pacing_s: float = float(profile.get("pacing_s", 0.0) or 0.0)
-        self._retries: int = int(profile.get("retries", 3) or 3)
-        self._backoff_base_s: float = float(profile.get("backoff_base_s", 0.0) or 0.0)
+        # profile-controlled connect delay
+        self._connect_delay_s: float = profile.connect_delay_s
 
-        # NEW: profile-controlled connect delay
-        self._connect_delay_s: float = float(profile.get("connect_delay_s", 0.0) or 0.0)
+        # Adaptive wait after each request (see _adapt_message_wait)
+        self._min_msg_delay: float = profile.message_wait_s
+        self._inter_msg_delay: float = self._min_msg_delay
+        self._msg_ok_streak: int = 0
+        self._msg_recovering: bool = False
+        # Earliest monotonic time the next request may go out (see _request_gate)
+        self._next_request_ts: float = 0.0
 
         self._connected_once: bool = False
         self._io_lock = asyncio.Lock()
 
-        # SAVE Connect queue/worker (only used if _use_queue)
-        self._queue: asyncio.Queue[tuple[str, Callable[[], Awaitable[Any]], asyncio.Future[Any]]] | None = None
-        self._worker_task: asyncio.Task | None = None
-        self._stop_worker = asyncio.Event()
+        # Cached read plan for the last register map seen: (register_defs, (holding, input))
+        self._plan_cache: tuple[Any, tuple[list[_ReadRange], list[_ReadRange]]] | None = None
+
+        # Cached pymodbus call shapes (see _call_read/_call_write)
+        self._read_invoker: Callable[..., Awaitable[Any]] | None = None
+        self._write_invoker: Callable[..., Awaitable[Any]] | None = None
+
+        # Cleared when the gateway rejects FC16; write_registers then uses FC06 per register
+        self._multi_write_supported: bool = True
 
         _LOGGER.info(
             "Modbus client using gateway profile '%s' "
-            "(max_batch_size=%s, bridge_holes=%s, force_input_as_holding=%s, "
-            "use_queue=%s, pacing_s=%s, retries=%s, backoff_base_s=%s)",
+            "(max_batch_size=%s, bridge_holes=%s, max_gap=%s, force_input_as_holding=%s, "
+            "serialize=%s, pacing_s=%s, retries=%s, backoff_base_s=%s)",
             self.gateway_profile,
             self._max_batch_size,
             self._bridge_holes,
+            self._max_gap,
             self._force_input_as_holding,
-            self._use_queue,
+            self._serialize,
             self._pacing_s,
             self._retries,
             self._backoff_base_s,
@@ -141,12 +405,22 @@ class ModbusTcpClient:
             # If your HA/pymodbus build does not accept it, it will raise TypeError
             # and we fall back to constructor without timeout.
             try:
-                self._client = AsyncModbusTcpClient(self.host, port=self.port, timeout=DEFAULT_TIMEOUT_S)
+                self._client = AsyncModbusTcpClient(
+                    self.host, port=self.port, timeout=self.timeout_s, retries=self._client_retries
+                )
             except TypeError:
                 self._client = AsyncModbusTcpClient(self.host, port=self.port)
 
         if not self._client.connected:
-            await self._client.connect()
+            if self.connect_timeout_s is not None:
+                async with asyncio.timeout(self.connect_timeout_s):
+                    await self._client.connect()
+            else:
+                await self._client.connect()
+            if not self._client.connected:
+                raise ConnectionError(f"Could not connect to {self.host}:{self.port}")
+            _enable_tcp_keepalive(self._client)
+            self._seed_invokers(self._client)
             # "delay" from old yaml: some gateways need a short pause after connect.
             if not self._connected_once:
                 self._connected_once = True
@@ -167,9 +441,6 @@ class ModbusTcpClient:
         self._connected_once = False
 
     async def async_close(self) -> None:
-        # stop worker first (so it doesn't keep using client)
-        await self._stop_queue_worker()
-
         if self._client is not None:
             try:
                 await _safe_client_close(self._client)
@@ -177,79 +448,55 @@ class ModbusTcpClient:
                 pass
         self._client = None
         self._connected_once = False
+        self._plan_cache = None
 
     # ----------------------------
-    # Queue worker (SAVE Connect safe mode)
+    # Serialized IO (SAVE Connect safe mode)
     # ----------------------------
 
-    async def _ensure_queue_worker(self) -> None:
-        if not self._use_queue:
-            return
-        if self._queue is None:
-            self._queue = asyncio.Queue()
-        if self._worker_task is None or self._worker_task.done():
-            self._stop_worker.clear()
-            self._worker_task = asyncio.create_task(self._queue_worker(), name="systemair_modbus_queue_worker")
-
-    async def _stop_queue_worker(self) -> None:
-        if self._worker_task is None:
-            return
-        self._stop_worker.set()
-        try:
-            self._worker_task.cancel()
-        except Exception:  # noqa: BLE001
-            pass
-        try:
-            await asyncio.wait_for(asyncio.shield(self._worker_task), timeout=1.0)
-        except Exception:  # noqa: BLE001
-            pass
-        self._worker_task = None
-        self._queue = None
-
-    async def _queue_worker(self) -> None:
-        """Single worker to serialize Modbus requests (SAVE Connect robustness)."""
-        assert self._queue is not None
-
-        while not self._stop_worker.is_set():
-            try:
-                op_name, op_coro_factory, fut = await self._queue.get()
-            except asyncio.CancelledError:
-                return
-
-            if fut.cancelled():
-                self._queue.task_done()
-                continue
-
+    async def _serialized(self, op: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one op under io_lock, paced against the previous one (save_connect profile)."""
+        async with self._io_lock:
+            await self._request_gate()
             try:
-                result = await op_coro_factory()
-                if not fut.cancelled():
-                    fut.set_result(result)
-            except Exception as e:  # noqa: BLE001
-                if not fut.cancelled():
-                    fut.set_exception(e)
+                return await op()
             finally:
-                # pacing between requests for SAVE Connect
-                if self._pacing_s > 0:
-                    try:
-                        await asyncio.sleep(self._pacing_s)
-                    except asyncio.CancelledError:
-                        return
-                self._queue.task_done()
-
-    async def _enqueue(self, op_name: str, op: Callable[[], Awaitable[Any]]) -> Any:
-        """Enqueue an op and wait for result. Only used in save_connect profile."""
-        await self._ensure_queue_worker()
-        assert self._queue is not None
-
-        loop = asyncio.get_running_loop()
-        fut: asyncio.Future[Any] = loop.create_future()
-        await self._queue.put((op_name, op, fut))
-        return await fut
+                # pacing between requests for SAVE Connect; the next request sits it out
+                self._hold_off(self._pacing_s)
 
     # ----------------------------
     # Signature-defensive pymodbus calls
     # ----------------------------
 
+    def _seed_invokers(self, client: AsyncModbusTcpClient) -> None:
+        """Pick the pymodbus call shapes from the method signatures, skipping the TypeError probe.
+
+        Leaves the invoker unset (so _call_read/_call_write probe as before) if the
+        signature is unavailable or doesn't name a known slave/unit keyword.
+        """
+        if self._read_invoker is None:
+            params = _signature_params(getattr(client, "read_holding_registers", None))
+            kw = next((k for k in _SLAVE_KWS if k in params), None)
+            if kw is not None and "count" in params:
+                self._read_invoker = _READ_CALLS[_SLAVE_KWS.index(kw)]
+        if self._write_invoker is None:
+            params = _signature_params(getattr(client, "write_register", None))
+            kw = next((k for k in _SLAVE_KWS if k in params), None)
+            if kw is not None:
+                self._write_invoker = _WRITE_CALLS[_SLAVE_KWS.index(kw)]
+
+    def _share_slave_kw(self, invoker: Callable[..., Awaitable[Any]]) -> None:
+        """pymodbus names the slave/unit keyword the same for reads and writes: once one side
+        has found it, seed the other side so it doesn't need its own TypeError probe."""
+        kw = _SLAVE_KW_BY_CALL.get(invoker)
+        if kw is None:
+            return
+        i = _SLAVE_KWS.index(kw)
+        if self._read_invoker is None:
+            self._read_invoker = _READ_CALLS[i]
+        if self._write_invoker is None:
+            self._write_invoker = _WRITE_CALLS[i]
+
     async def _call_read(
         self,
         client: AsyncModbusTcpClient,
@@ -260,402 +507,699 @@ class ModbusTcpClient:
         """Call a pymodbus read method in a signature-defensive way.
 
         IMPORTANT: try to pass slave/unit FIRST (many Modbus servers are strict).
+        The first call shape that works is cached, so the probing only happens once.
         """
         fn = getattr(client, fn_name)
 
-        # 1) Preferred: keyword-only count supported + explicit slave/unit id
-        for kw in ("slave", "unit", "device_id", "unit_id"):
+        invoker = self._read_invoker
+        if invoker is not None:
             try:
-                return await fn(address, count=count, **{kw: self.slave})
+                return await invoker(fn, address, count, self.slave)
             except TypeError:
-                pass
-
-        # 2) Next: keyword-only count supported (no slave/unit)
-        try:
-            return await fn(address, count=count)
-        except TypeError:
-            pass
+                # Signature no longer matches (e.g. pymodbus upgraded) -> probe again
+                self._read_invoker = None
 
-        # 3) Try positional (address, count) with explicit slave/unit id via keywords (count positional)
-        for kw in ("slave", "unit", "device_id", "unit_id"):
+        for invoker in _READ_CALLS[:-1]:
             try:
-                return await fn(address, count, **{kw: self.slave})
+                rr = await invoker(fn, address, count, self.slave)
             except TypeError:
-                pass
-
-        # 4) Some environments accept positional (address, count)
-        try:
-            return await fn(address, count)
-        except TypeError:
-            pass
+                continue
+            self._read_invoker = invoker
+            self._share_slave_kw(invoker)
+            return rr
+
+        # Last resort: positional including slave (rare)
+        invoker = _READ_CALLS[-1]
+        rr = await invoker(fn, address, count, self.slave)
+        self._read_invoker = invoker
+        return rr
 
-        # 5) Last resort: positional including slave (rare)
-        return await fn(address, count, self.slave)
+    async def _call_write(
+        self,
+        client: AsyncModbusTcpClient,
+        address: int,
+        value: int | list[int],
+        fn_name: str = "write_register",
+    ):
+        """Call a pymodbus write method (FC06 or FC16) in a signature-defensive way.
 
-    async def _call_write(self, client: AsyncModbusTcpClient, address: int, value: int):
-        """Call a pymodbus write_register method in a signature-defensive way."""
-        fn = client.write_register
+        Both methods take (address, value(s)) plus the same slave/unit keyword, so they
+        share the cached call shape.
+        """
+        fn = getattr(client, fn_name)
 
-        # 1) Preferred: explicit slave/unit id
-        for kw in ("slave", "unit", "device_id", "unit_id"):
+        invoker = self._write_invoker
+        if invoker is not None:
             try:
-                return await fn(address, value, **{kw: self.slave})
+                return await invoker(fn, address, value, self.slave)
             except TypeError:
-                pass
-
-        # 2) Simple (address, value)
-        try:
-            return await fn(address, value)
-        except TypeError:
-            pass
+                self._write_invoker = None
 
-        # 3) Last resort: positional including slave
-        return await fn(address, value, self.slave)
+        for invoker in _WRITE_CALLS[:-1]:
+            try:
+                rr = await invoker(fn, address, value, self.slave)
+            except TypeError:
+                continue
+            self._write_invoker = invoker
+            self._share_slave_kw(invoker)
+            return rr
+
+        # Last resort: positional including slave
+        invoker = _WRITE_CALLS[-1]
+        rr = await invoker(fn, address, value, self.slave)
+        self._write_invoker = invoker
+        return rr
 
     # ----------------------------
     # Helpers
     # ----------------------------
 
     @staticmethod
-    def _is_gateway_busy(rr: Any) -> bool:
-        """Best-effort detection of 'device busy' / 'gateway target failed'."""
-        try:
-            if rr is None:
-                return False
-            if not hasattr(rr, "isError") or not rr.isError():
-                return False
-            exc_code = getattr(rr, "exception_code", None)
-            # Common Modbus exception codes:
-            # 06 = Slave Device Busy
-            # 0B (11) = Gateway Target Device Failed to Respond
-            return exc_code in (6, 11)
-        except Exception:  # noqa: BLE001
-            return False
+    def _exception_code(rr: Any) -> int | None:
+        """Modbus exception code of an error response, read from the structured attribute."""
+        if rr is None:
+            return None
+        return getattr(rr, "exception_code", None) or None
+
+    @classmethod
+    def _is_gateway_busy(cls, rr: Any) -> bool:
+        """Detection of 'device busy' / 'gateway target failed'."""
+        return cls._exception_code(rr) in _BUSY_EXCEPTION_CODES
+
+    @classmethod
+    def _is_illegal_function(cls, rr: Any) -> bool:
+        """True if the gateway rejected the function code itself (e.g. FC04 unsupported)."""
+        return cls._exception_code(rr) == EXC_ILLEGAL_FUNCTION
 
     def _calc_backoff(self, attempt: int, busy: bool) -> float:
         if self._backoff_base_s <= 0:
             return 0.0
-        # Exponential backoff. If "busy", be a bit nicer.
-        base = self._backoff_base_s * (2**attempt)
+        # Exponential backoff (exponent capped; the result is clamped below anyway).
+        # If "busy", be a bit nicer.
+        base = self._backoff_base_s * (2 ** min(attempt, BACKOFF_MAX_EXPONENT))
         if busy:
             base *= 1.5
+        # Jitter so several pollers hitting the same gateway don't retry in lockstep
+        base += base * BACKOFF_JITTER * random.random()
         # Cap to something reasonable
         return min(base, 5.0)
 
+    def _adapt_message_wait(self, ok: bool) -> None:
+        """Grow the inter-message delay after a struggling request, shrink it after clean runs."""
+        if not ok:
+            self._msg_recovering = True
+            self._msg_ok_streak = 0
+            return
+        if self._msg_recovering:
+            self._msg_recovering = False
+            self._inter_msg_delay = min(self._inter_msg_delay + MESSAGE_WAIT_STEP_UP_S, MESSAGE_WAIT_MAX_S)
+            return
+        self._msg_ok_streak += 1
+        if self._msg_ok_streak >= MESSAGE_WAIT_DECREASE_AFTER:
+            self._msg_ok_streak = 0
+            self._inter_msg_delay = max(self._inter_msg_delay - MESSAGE_WAIT_STEP_DOWN_S, self._min_msg_delay)
+
+    def _hold_off(self, extra_s: float = 0.0) -> None:
+        """Start the quiet gap after a request; the next request waits it out in _request_gate.
+
+        The caller returns (and its response is decoded) while the gap runs, instead of
+        sleeping before handing the result back.
+        """
+        self._next_request_ts = time.monotonic() + self._inter_msg_delay + extra_s
+
+    async def _request_gate(self) -> None:
+        delay = self._next_request_ts - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
     @staticmethod
     def _decode_registers(registers: list[int], idx: int, data_type: str) -> int | None:
-        try:
-            if data_type == "int16":
-                val = registers[idx] & 0xFFFF
-                if val >= 0x8000:
-                    val -= 0x10000
-                return val
-            if data_type == "uint16":
-                return registers[idx] & 0xFFFF
-            if data_type == "uint32":
-                # Systemair uses L/H register pairs: addr=low word, addr+1=high word
-                lo = registers[idx] & 0xFFFF
-                hi = registers[idx + 1] & 0xFFFF
-                return (hi << 16) | lo
-        except Exception:  # noqa: BLE001
-            return None
+        # Callers guarantee idx (and idx + 1 for uint32) is within registers.
+        if data_type == "int16":
+            val = registers[idx] & 0xFFFF
+            if val >= 0x8000:
+                val -= 0x10000
+            return val
+        if data_type == "uint16":
+            return registers[idx] & 0xFFFF
+        if data_type == "uint32":
+            # Systemair uses L/H register pairs: addr=low word, addr+1=high word
+            lo = registers[idx] & 0xFFFF
+            hi = registers[idx + 1] & 0xFFFF
+            return (hi << 16) | lo
         return None
 
-    @staticmethod
-    def _reg_len(data_type: str) -> int:
-        return 2 if data_type == "uint32" else 1
-
     # ----------------------------
     # Core IO operations
     # ----------------------------
 
+    async def _timed_read(self, client: AsyncModbusTcpClient, fn_name: str, address: int, count: int):
+        """One read, bounded by _read_timeout_s; a request that got no answer raises TimeoutError."""
+        try:
+            return await asyncio.wait_for(
+                self._call_read(client, fn_name, address, count),
+                self._read_timeout_s,
+            )
+        except ModbusIOException as e:
+            # pymodbus 3.11 reports "no response" (and a request cut off by wait_for)
+            # as ModbusIOException; to us it is a timeout like any other.
+            if _is_connection_error(e):
+                raise TimeoutError(f"No response to {fn_name} @{address} from {self.host}:{self.port}") from e
+            raise
+
     async def _read_once(self, fn_name: str, address: int, count: int):
         """Single read attempt."""
         client = await self._ensure_client()
-        return await self._call_read(client, fn_name, address, count)
+        return await self._timed_read(client, fn_name, address, count)
 
-    async def _write_once(self, address: int, value: int):
+    async def _write_once(self, address: int, value: int | list[int], fn_name: str = "write_register"):
         """Single write attempt."""
         client = await self._ensure_client()
-        return await self._call_write(client, address, value)
+        return await self._call_write(client, address, value, fn_name)
 
-    async def _robust_read(self, fn_name: str, address: int, count: int):
-        """Read with retries/backoff and reconnect on failure (used mainly for SAVE Connect)."""
-        last_exc: Exception | None = None
-        last_rr: Any = None
+    async def _with_retries(self, once: Callable[[], Awaitable[Any]]):
+        """Run one request with retries/backoff and reconnect on failure (used mainly for SAVE Connect).
 
-        for attempt in range(max(1, self._retries)):
+        Returns the first good response, an illegal-function response (final, no retry), or
+        the last error response so callers can inspect it; an exception on the final attempt
+        propagates.
+        """
+        last = max(1, self._retries) - 1
+        for attempt in range(last + 1):
             try:
-                rr = await self._read_once(fn_name, address, count)
-                last_rr = rr
-                if rr is not None and hasattr(rr, "isError") and rr.isError():
-                    busy = self._is_gateway_busy(rr)
-                    backoff = self._calc_backoff(attempt, busy)
-                    if backoff > 0:
-                        await asyncio.sleep(backoff)
-                    # For some error patterns, reconnect helps
-                    if attempt < (self._retries - 1):
-                        await self._force_reconnect()
-                        continue
-                return rr
-            except Exception as e:  # noqa: BLE001
-                last_exc = e
+                rr = await once()
+            except Exception:  # noqa: BLE001
+                self._adapt_message_wait(False)
+                if attempt == last:
+                    raise
                 backoff = self._calc_backoff(attempt, False)
-                if backoff > 0:
-                    await asyncio.sleep(backoff)
-                if attempt < (self._retries - 1):
-                    await self._force_reconnect()
-                    continue
-
-        if last_exc is not None:
-            raise last_exc
-        return last_rr
+            else:
+                if rr is None or not (hasattr(rr, "isError") and rr.isError()):
+                    self._adapt_message_wait(True)
+                    return rr
+                # The gateway rejects the function code itself; retrying or reconnecting
+                # won't change that, so hand it back for the caller's fallback (FC03/FC06).
+                if self._is_illegal_function(rr):
+                    return rr
+                busy = self._is_gateway_busy(rr)
+                if busy:
+                    self._adapt_message_wait(False)
+                if attempt == last:
+                    return rr
+                backoff = self._calc_backoff(attempt, busy)
+            if backoff > 0:
+                await asyncio.sleep(backoff)
+            # For some error patterns, reconnect helps
+            await self._force_reconnect()
 
-    async def _robust_write(self, address: int, value: int):
-        """Write with retries/backoff and reconnect on failure (used mainly for SAVE Connect)."""
-        last_exc: Exception | None = None
-        last_rr: Any = None
-
-        for attempt in range(max(1, self._retries)):
-            try:
-                rr = await self._write_once(address, value)
-                last_rr = rr
-                if rr is not None and hasattr(rr, "isError") and rr.isError():
-                    busy = self._is_gateway_busy(rr)
-                    backoff = self._calc_backoff(attempt, busy)
-                    if backoff > 0:
-                        await asyncio.sleep(backoff)
-                    if attempt < (self._retries - 1):
-                        await self._force_reconnect()
-                        continue
-                return rr
-            except Exception as e:  # noqa: BLE001
-                last_exc = e
-                backoff = self._calc_backoff(attempt, False)
-                if backoff > 0:
-                    await asyncio.sleep(backoff)
-                if attempt < (self._retries - 1):
-                    await self._force_reconnect()
-                    continue
+    async def _robust_read(self, fn_name: str, address: int, count: int):
+        """Read with retries/backoff and reconnect on failure."""
+        return await self._with_retries(lambda: self._read_once(fn_name, address, count))
 
-        if last_exc is not None:
-            raise last_exc
-        return last_rr
+    async def _robust_write(self, address: int, value: int | list[int], fn_name: str = "write_register"):
+        """Write with retries/backoff and reconnect on failure."""
+        return await self._with_retries(lambda: self._write_once(address, value, fn_name))
 
     async def _do_read(self, fn_name: str, address: int, count: int):
         """Read wrapper with profile-specific execution path."""
-        if self._use_queue:
-            # SAVE Connect: serialized + robust read in queue
-            async def op():
-                rr = await self._robust_read(fn_name, address, count)
-                if DEFAULT_MESSAGE_WAIT_S > 0:
-                    await asyncio.sleep(DEFAULT_MESSAGE_WAIT_S)
-                return rr
-
-            return await self._enqueue(f"read:{fn_name}@{address}x{count}", op)
+        if self._serialize:
+            # SAVE Connect: serialized + robust read
+            return await self._serialized(lambda: self._robust_read(fn_name, address, count))
 
-        # Generic/EW11: preserve old behavior (direct) + io_lock + message_wait
-        client = await self._ensure_client()
+        # Generic/EW11: direct read under io_lock. pymodbus runs one request at a time on the
+        # connection anyway; holding the lock keeps a queued write's wait out of our timeout.
         async with self._io_lock:
-            rr = await self._call_read(client, fn_name, address, count)
-            if DEFAULT_MESSAGE_WAIT_S > 0:
-                await asyncio.sleep(DEFAULT_MESSAGE_WAIT_S)
+            client = await self._ensure_client()
+            await self._request_gate()
+            try:
+                rr = await self._timed_read(client, fn_name, address, count)
+            except Exception:
+                self._adapt_message_wait(False)
+                raise
+            self._adapt_message_wait(not self._is_gateway_busy(rr))
+            self._hold_off()
         return rr
 
-    async def _do_write(self, address: int, value: int):
+    async def _do_write(self, address: int, value: int | list[int], fn_name: str = "write_register"):
         """Write wrapper with profile-specific execution path."""
-        if self._use_queue:
-            # SAVE Connect: serialized + robust write in queue
-            async def op():
-                rr = await self._robust_write(address, value)
-                if DEFAULT_MESSAGE_WAIT_S > 0:
-                    await asyncio.sleep(DEFAULT_MESSAGE_WAIT_S)
-                return rr
+        if self._serialize:
+            # SAVE Connect: serialized + robust write
+            return await self._serialized(lambda: self._robust_write(address, value, fn_name))
 
-            return await self._enqueue(f"write@{address}={value}", op)
-
-        # Generic/EW11: preserve old behavior (direct) + io_lock + message_wait
-        client = await self._ensure_client()
+        # Generic/EW11: direct write under io_lock (waits for the read in progress, if any)
         async with self._io_lock:
-            rr = await self._call_write(client, address, value)
-            if DEFAULT_MESSAGE_WAIT_S > 0:
-                await asyncio.sleep(DEFAULT_MESSAGE_WAIT_S)
+            client = await self._ensure_client()
+            await self._request_gate()
+            rr = await self._call_write(client, address, value, fn_name)
+            self._hold_off()
         return rr
 
     # ----------------------------
-    # Public API
+    # Read planning
     # ----------------------------
 
-    async def read_register_map(self, register_defs: list[dict[str, Any]]) -> dict[str, Any]:
-        # Ensure worker exists early (SAVE Connect only)
-        await self._ensure_queue_worker()
+    def _build_read_plan(
+        self, register_defs: Sequence[Any]
+    ) -> tuple[list[_ReadRange], list[_ReadRange]]:
+        """Turn a register map into (holding, input) lists of read ranges.
 
-        results: dict[str, Any] = {}
+        Accepts RegisterDef-like objects (attribute access) or plain dicts.
+        """
+        # Normalize every definition once:
+        # (addr, reg_len, data_type, key, scale, offset, precision, input_type)
+        norm: list[tuple[int, int, str, Any, float, float, int | None, str]] = []
+        for d in register_defs:
+            if isinstance(d, dict):
+                address = d["address"]
+                dt = d.get("data_type", "int16")
+                key = d.get("key")
+                scale = d.get("scale", 1.0)
+                offset = d.get("offset", 0.0)
+                precision = d.get("precision")
+                input_type = d.get("input_type")
+            else:
+                address = d.address
+                dt = d.data_type
+                key = d.key
+                scale = d.scale
+                offset = d.offset
+                precision = d.precision
+                input_type = d.input_type
+            # Definitions without a key produce nothing; leave them out of the plan entirely.
+            if not key:
+                continue
+            norm.append(
+                (
+                    int(address),
+                    _REG_LEN.get(dt, 1),
+                    dt,
+                    key,
+                    float(scale or 1.0),
+                    float(offset or 0.0),
+                    int(precision) if precision is not None else None,
+                    input_type or "holding",
+                )
+            )
+        norm.sort(key=itemgetter(0))
+
+        # Partition in one pass (the sort is stable, so both groups stay address-ordered)
+        groups: dict[str, list[tuple]] = {"holding": [], "input": []}
+        for t in norm:
+            group = groups.get(t[7])
+            if group is not None:
+                group.append(t)
+        holding_plan = self._plan_group(groups["holding"])
+        input_plan = self._plan_group(groups["input"])
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            ranges = holding_plan + input_plan
+            read_regs = sum(r_count for _, r_count, _ in ranges)
+            used_regs = len({(t[7], t[0] + i) for t in norm for i in range(t[1])})
+            _LOGGER.debug(
+                "Read plan: %s requests for %s definitions, %s registers read (%s bridged, max_gap=%s)",
+                len(ranges),
+                len(norm),
+                read_regs,
+                read_regs - used_regs,
+                self._max_gap,
+            )
+
+        return holding_plan, input_plan
+
+    def _plan_group(self, group: list[tuple]) -> list[_ReadRange]:
+        """Batch one (sorted) group and split it into read ranges for this profile."""
+        if not group:
+            return []
+
+        # Build contiguous-ish batches as (start, end, defs)
+        batches: list[tuple[int, int, list[tuple]]] = []
+        batch: list[tuple] = []
+        batch_start = 0
+        last_end = 0
+
+        for t in group:
+            addr = t[0]
+            end = addr + t[1]
+
+            if not batch:
+                batch = [t]
+                batch_start = addr
+                last_end = end
+                continue
 
-        defs_sorted = sorted(register_defs, key=lambda d: int(d["address"]))
+            # Strict contiguous by default: addr == last_end
+            contiguous = addr == last_end
+
+            # Generic profile may bridge small "holes" (unused registers are
+            # read and discarded, saving a full round-trip per hole)
+            if self._bridge_holes:
+                contiguous = addr - last_end <= self._max_gap
+
+            # Never exceed what a single Modbus read can return
+            if contiguous and max(last_end, end) - batch_start > MAX_BATCH_REGS:
+                contiguous = False
+
+            if contiguous:
+                batch.append(t)
+                if end > last_end:
+                    last_end = end
+            else:
+                batches.append((batch_start, last_end, batch))
+                batch = [t]
+                batch_start = addr
+                last_end = end
+
+        if batch:
+            batches.append((batch_start, last_end, batch))
+
+        plan: list[_ReadRange] = []
+        for start, end, b in batches:
+            count = end - start
+
+            max_batch = self._max_batch_size
+            if max_batch is None:
+                ranges = [(start, count)]
+            else:
+                # Ensure we can still read uint32 values (2 registers), and never split a pair.
+                uint32_lows = {t[0] for t in b if t[1] == 2}
+                ranges = self._split_range(start, count, max(2, int(max_batch)), uint32_lows)
+
+            for r_start, r_count in ranges:
+                r_end = r_start + r_count
+                # Only decode values fully covered by this sub-range
+                entries = [
+                    (
+                        key,
+                        addr - r_start,
+                        dt,
+                        _decoder_kind(dt, scale, offset, precision),
+                        _UNPACKERS.get(dt),
+                        scale,
+                        offset,
+                        precision,
+                    )
+                    for addr, reg_len, dt, key, scale, offset, precision, _ in b
+                    if addr >= r_start and addr + reg_len <= r_end
+                ]
+                plan.append((r_start, r_count, entries))
+
+        return plan
+
+    def _split_rejected_range(self, rng: _ReadRange, rr: Any) -> list[_ReadRange] | None:
+        """Split a bridged range at its widest hole if the gateway rejected the read.
+
+        Some gateways answer ILLEGAL DATA ADDRESS (exception code 2) when a read
+        covers undefined registers. Returns the two halves, or None if not applicable.
+        """
+        if not self._bridge_holes or self._exception_code(rr) != EXC_ILLEGAL_DATA_ADDRESS:
+            return None
 
-        holding = [d for d in defs_sorted if (d.get("input_type") or "holding") == "holding"]
-        inputs = [d for d in defs_sorted if (d.get("input_type") or "holding") == "input"]
+        r_start, r_count, entries = rng
+        best_gap = 0
+        best_i = -1
+        covered_end = 0
+        for i, (_, idx, dt, *_rest) in enumerate(entries):
+            if i and idx - covered_end > best_gap:
+                best_gap = idx - covered_end
+                best_i = i
+            covered_end = max(covered_end, idx + _REG_LEN.get(dt, 1))
+        if best_i < 0:
+            return None
 
-        async def read_group(group: list[dict[str, Any]], group_type: str) -> None:
-            """Read one group (holding/input) in contiguous batches.
+        left = entries[:best_i]
+        left_count = max(idx + _REG_LEN.get(dt, 1) for _, idx, dt, *_rest in left)
+        shift = entries[best_i][1]
+        right = [(key, idx - shift, *rest) for key, idx, *rest in entries[best_i:]]
 
-            group_type: "holding" | "input" (the *logical* type from the register map).
-            """
-            if not group:
-                return
+        _LOGGER.debug(
+            "Gateway rejected bridged read @%s len=%s; splitting at a %s-register hole",
+            r_start,
+            r_count,
+            best_gap,
+        )
+        return [
+            (r_start, left_count, left),
+            (r_start + shift, r_count - shift, right),
+        ]
 
-            # Build contiguous-ish batches
-            batches: list[list[dict[str, Any]]] = []
-            batch: list[dict[str, Any]] = []
-            last_end: int | None = None
+    @staticmethod
+    def _split_range(
+        start: int, count: int, max_count: int, uint32_lows: set[int] | frozenset[int] = frozenset()
+    ) -> list[tuple[int, int]]:
+        out: list[tuple[int, int]] = []
+        s = start
+        remaining = count
+        while remaining > 0:
+            c = min(max_count, remaining)
+            # Chunk would end on the low word of a uint32: push the whole pair to the next chunk
+            if c < remaining and c > 1 and (s + c - 1) in uint32_lows:
+                c -= 1
+            out.append((s, c))
+            s += c
+            remaining -= c
+        return out
 
-            for d in group:
-                addr = int(d["address"])
-                length = self._reg_len(d.get("data_type", "int16"))
+    # ----------------------------
+    # Public API
+    # ----------------------------
 
-                if not batch:
-                    batch = [d]
-                    last_end = addr + length
-                    continue
+    async def read_register_map(self, register_defs: Sequence[Any]) -> dict[str, Any]:
+        # The register map is static for the lifetime of the integration, so the
+        # sort/batch/split work is done once and reused while the same object is passed in.
+        cached = self._plan_cache
+        if cached is None or cached[0] is not register_defs:
+            cached = (register_defs, self._build_read_plan(register_defs))
+            self._plan_cache = cached
+        holding_plan, input_plan = cached[1]
+
+        # Generic path: connect up front, so a dead gateway costs one connect
+        # attempt instead of one timeout per range. Connection errors propagate
+        # (the coordinator reports them as a failed update, the config flow classifies them).
+        if not self._serialize:
+            async with self._io_lock:
+                await self._ensure_client()
+
+        # Set by whichever range first hits a connection error; all remaining ranges are
+        # skipped and the error is raised at the end of the poll.
+        aborted: BaseException | None = None
+
+        async def read_range(rng: _ReadRange, group_type: str) -> tuple[list[_ReadRange], list[tuple[list, Any]]]:
+            """Read one planned range.
 
-                # Strict contiguous by default: addr == last_end
-                contiguous = last_end is not None and addr == last_end
+            group_type: "holding" | "input" (the *logical* type from the register map).
+            Returns (ranges actually used, [(entries, registers)]): a bridged range the
+            gateway rejects is split and its halves read instead.
+            """
+            nonlocal aborted
+            r_start, r_count, entries = rng
 
-                # Generic profile may allow bridging "holes"
-                if self._bridge_holes and last_end is not None:
-                    contiguous = addr <= last_end
+            if aborted is not None:
+                return [rng], []
 
-                if contiguous:
-                    batch.append(d)
-                    last_end = max(last_end, addr + length)
-                else:
-                    batches.append(batch)
-                    batch = [d]
-                    last_end = addr + length
-
-            if batch:
-                batches.append(batch)
-
-            def _split_ranges(start: int, count: int, max_count: int) -> list[tuple[int, int]]:
-                out: list[tuple[int, int]] = []
-                s = start
-                remaining = count
-                while remaining > 0:
-                    c = min(max_count, remaining)
-                    out.append((s, c))
-                    s += c
-                    remaining -= c
-                return out
-
-            for b in batches:
-                start = min(int(d["address"]) for d in b)
-                end = max(int(d["address"]) + self._reg_len(d.get("data_type", "int16")) for d in b)
-                count = end - start
-
-                max_batch = self._max_batch_size
-                if max_batch is None:
-                    ranges = [(start, count)]
-                else:
-                    # Ensure we can still read uint32 values (2 registers).
-                    max_count = max(2, int(max_batch))
-                    ranges = _split_ranges(start, count, max_count)
-
-                for r_start, r_count in ranges:
-                    # Decide function code per batch.
-                    if group_type == "input" and self._force_input_as_holding:
-                        fn_name = "read_holding_registers"
-                    elif group_type == "input":
-                        fn_name = "read_input_registers"
-                    else:
-                        fn_name = "read_holding_registers"
+            # Decide function code per batch (looked up at call time, since
+            # _force_input_as_holding may flip during the first poll).
+            if group_type == "input" and self._force_input_as_holding:
+                fn_name = "read_holding_registers"
+            elif group_type == "input":
+                fn_name = "read_input_registers"
+            else:
+                fn_name = "read_holding_registers"
 
-                    rr = None
-                    exc: Exception | None = None
+            rr = None
+            exc: Exception | None = None
 
+            try:
+                rr = await self._do_read(fn_name, r_start, r_count)
+            except Exception as e:  # noqa: BLE001
+                exc = e
+
+            if _is_connection_error(exc):
+                if aborted is None:
+                    aborted = exc
+                _LOGGER.debug(
+                    "Modbus connection lost (%s @%s len=%s), aborting poll: %s",
+                    fn_name,
+                    r_start,
+                    r_count,
+                    exc,
+                )
+                return [rng], []
+
+            failed = (exc is not None) or (rr is not None and rr.isError())
+            rejected: Any = None
+
+            if failed:
+                # Auto-detect Save Connect: FC04 unsupported -> use FC03 for "input" regs.
+                # Only an ILLEGAL FUNCTION reply means that; anything else (e.g. ILLEGAL
+                # DATA ADDRESS on a bridged range) keeps FC04 and is split/skipped below.
+                if (
+                    fn_name == "read_input_registers"
+                    and not self._force_input_as_holding
+                    and self._is_illegal_function(rr)
+                ):
+                    rr2 = None
+                    exc2: Exception | None = None
                     try:
-                        rr = await self._do_read(fn_name, r_start, r_count)
+                        rr2 = await self._do_read("read_holding_registers", r_start, r_count)
                     except Exception as e:  # noqa: BLE001
-                        exc = e
-
-                    failed = (exc is not None) or (rr is not None and rr.isError())
-
-                    if failed:
-                        # Auto-detect Save Connect: FC04 unsupported -> use FC03 for "input" regs
-                        if fn_name == "read_input_registers" and not self._force_input_as_holding:
-                            rr2 = None
-                            exc2: Exception | None = None
-                            try:
-                                rr2 = await self._do_read("read_holding_registers", r_start, r_count)
-                            except Exception as e:  # noqa: BLE001
-                                exc2 = e
-
-                            if rr2 is not None and not rr2.isError():
-                                self._force_input_as_holding = True
-                                _LOGGER.info(
-                                    "Gateway does not support FC04 for input registers; "
-                                    "falling back to FC03 (holding) for all input registers."
-                                )
-                                rr = rr2
-                            else:
-                                _LOGGER.debug("Modbus read error %s @%s len=%s", fn_name, r_start, r_count)
-                                if exc is not None:
-                                    _LOGGER.debug("Read exception (%s): %s", fn_name, exc)
-                                if exc2 is not None:
-                                    _LOGGER.debug("Fallback exception (read_holding_registers): %s", exc2)
-                                continue
-                        else:
+                        exc2 = e
+
+                    if rr2 is not None and not rr2.isError():
+                        # Only the first range to get here switches over, logs and persists.
+                        if not self._force_input_as_holding:
+                            self._force_input_as_holding = True
+                            _LOGGER.info(
+                                "Gateway does not support FC04 for input registers (illegal function); "
+                                "falling back to FC03 (holding) for all input registers."
+                            )
+                            if self.on_input_as_holding is not None:
+                                try:
+                                    self.on_input_as_holding()
+                                except Exception as e:  # noqa: BLE001
+                                    _LOGGER.debug("Could not persist FC03 fallback: %s", e)
+                        rr = rr2
+                    else:
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
                             _LOGGER.debug("Modbus read error %s @%s len=%s", fn_name, r_start, r_count)
                             if exc is not None:
                                 _LOGGER.debug("Read exception (%s): %s", fn_name, exc)
-                            continue
-
-                    regs = list(rr.registers)
-
-                    for d in b:
-                        key = d.get("key")
-                        addr = int(d["address"])
-                        reg_len = self._reg_len(d.get("data_type", "int16"))
-
-                        # Only decode values fully covered by this sub-range
-                        if addr < r_start or (addr + reg_len) > (r_start + r_count):
-                            continue
-
-                        idx = addr - r_start
-                        dt = d.get("data_type", "int16")
-                        raw = self._decode_registers(regs, idx, dt)
-                        if raw is None:
-                            continue
-
-                        scale = float(d.get("scale", 1.0) or 1.0)
-                        offset = float(d.get("offset", 0.0) or 0.0)
-                        val: Any = raw * scale + offset
-
-                        precision = d.get("precision")
-                        if precision is not None:
-                            try:
-                                val = round(float(val), int(precision))
-                            except Exception:  # noqa: BLE001
-                                pass
+                            if exc2 is not None:
+                                _LOGGER.debug("Fallback exception (read_holding_registers): %s", exc2)
+                        rejected = rr2
+                else:
+                    # Can fire on every poll with a flaky gateway; skip the calls when quiet.
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Modbus read error %s @%s len=%s", fn_name, r_start, r_count)
+                        if exc is not None:
+                            _LOGGER.debug("Read exception (%s): %s", fn_name, exc)
+                    rejected = rr
+
+            if rr is None or rr.isError():
+                halves = self._split_rejected_range(rng, rejected)
+                if halves is None:
+                    return [rng], []
+                used: list[_ReadRange] = []
+                responses: list[tuple[list, Any]] = []
+                for half in halves:
+                    half_used, half_responses = await read_range(half, group_type)
+                    used.extend(half_used)
+                    responses.extend(half_responses)
+                return used, responses
+
+            # Index the response directly (no copy); only materialize
+            # if a pymodbus build hands back a non-indexable iterable.
+            regs = rr.registers
+            if not hasattr(regs, "__getitem__"):
+                regs = list(regs)
+
+            # Every planned entry lies within [0, r_count), so one length check per range
+            # makes all offsets valid. A response of any other length is not the one we
+            # asked for (truncated, or a stray reply), so the range is skipped.
+            if len(regs) != r_count:
+                _LOGGER.debug(
+                    "Unexpected Modbus response length %s @%s: got %s of %s registers",
+                    fn_name,
+                    r_start,
+                    len(regs),
+                    r_count,
+                )
+                return [rng], []
+
+            return [rng], [(entries, regs)]
+
+        async def read_group(plan: list[_ReadRange], group_type: str) -> list[tuple[list, Any]]:
+            """Read all ranges of one group in order."""
+            new_plan: list[_ReadRange] = []
+            responses: list[tuple[list, Any]] = []
+            for rng in plan:
+                used, rng_responses = await read_range(rng, group_type)
+                new_plan.extend(used)
+                responses.extend(rng_responses)
+            # Persist any splits in the cached plan so later polls skip the rejected reads.
+            if len(new_plan) != len(plan):
+                plan[:] = new_plan
+            return responses
+
+        # Ranges are read one at a time: pymodbus holds its transaction lock for a request's
+        # whole send/receive, so concurrent reads would only queue up behind each other.
+        # Logical input registers may be read via FC03 (Save Connect).
+        holding_responses = await read_group(holding_plan, "holding")
+        input_responses = await read_group(input_plan, "input")
+        if aborted is not None:
+            raise aborted
+        responses = holding_responses + input_responses
+
+        # Decoding is pure CPU; on very large maps run it off the event loop.
+        if sum(len(regs) for _, regs in responses) > DECODE_IN_THREAD_MIN_REGS:
+            return await asyncio.to_thread(self._decode_all, responses)
+        return self._decode_all(responses)
+
+    @classmethod
+    def _decode_all(cls, responses: list[tuple[list, Any]]) -> dict[str, Any]:
+        """Decode (entries, registers) pairs from read_register_map into key -> value.
+
+        Pure function (no client state), so it is safe to run in a worker thread.
+        """
+        results: dict[str, Any] = {}
+        # One buffer per call (not per client: this may run in a worker thread), sized
+        # for the largest possible response and refilled for each range.
+        buf = bytearray(MAX_BATCH_REGS * 2)
+
+        for entries, regs in responses:
+            # Packed lazily: ranges holding only raw uint16 values never need the buffer.
+            packed = False
+
+            for key, idx, dt, kind, unpack, scale, offset, precision in entries:
+                # Values stay float on every path (sensor states must not change type).
+                if kind == _DECODE_UINT16_RAW:
+                    results[key] = float(regs[idx] & 0xFFFF)
+                    continue
 
-                        if key:
-                            results[key] = val
+                if kind == _DECODE_GENERIC:
+                    raw = cls._decode_registers(regs, idx, dt)
+                    if raw is None:
+                        continue
+                else:
+                    if not packed:
+                        # Decode the rest of the response in C: pack once, unpack at each offset.
+                        struct.pack_into(f"<{len(regs)}H", buf, 0, *regs)
+                        packed = True
+                    raw = unpack(buf, idx * 2)[0]
+
+                if kind == _DECODE_RAW:
+                    results[key] = float(raw)
+                    continue
 
-        # Read holding registers first
-        await read_group(holding, "holding")
-        # Then logical input registers (which may be read via FC03 on Save Connect)
-        await read_group(inputs, "input")
+                val = raw * scale + offset
+                if precision is not None:
+                    val = round(val, precision)
+                results[key] = val
 
         return results
 
     async def write_register(self, address: int, value: int) -> None:
-        # Ensure worker exists early (SAVE Connect only)
-        await self._ensure_queue_worker()
-
         rr = await self._do_write(address, value)
         if rr is None or rr.isError():
             raise RuntimeError(f"Modbus write failed @ {address} = {value}")
 
+    async def write_registers(self, address: int, values: Sequence[int]) -> None:
+        """Write consecutive registers starting at address in one FC16 request.
+
+        Gateways that reject FC16 are remembered and get one FC06 write per register.
+        """
+        values = list(values)
+        if self._multi_write_supported and len(values) > 1:
+            rr = await self._do_write(address, values, "write_registers")
+            if rr is not None and not rr.isError():
+                return
+            if not self._is_illegal_function(rr):
+                raise RuntimeError(f"Modbus write failed @ {address} = {values}")
+            _LOGGER.info("Gateway does not support FC16 (write multiple); using FC06 per register.")
+            self._multi_write_supported = False
+
+        for i, value in enumerate(values):
+            await self.write_register(address + i, value)
+
     async def write_0_1c(self, address: int, temp_c: float) -> None:
         """Write a temperature value in 0.1°C units (e.g. 21.5°C -> 215).
 
@@ -0,0 +1,19 @@
+"""Building blocks shared by the Systemair model definitions."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+# Slotted: ~85 instances per model, no per-instance __dict__
+@dataclass(frozen=True, slots=True)
+class RegisterDef:
+    key: str
+    address: int
+    input_type: str = "holding"  # "holding" | "input"
+    data_type: str = "int16"     # "int16" | "uint16" | "uint32"
+    scale: float = 1.0
+    offset: float = 0.0
+    precision: int | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
@@ -4,22 +4,63 @@ All addresses in this file are Modbus client offsets (PDF address - 1)
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
-
-@dataclass(frozen=True)
-class RegisterDef:
-    key: str
-    address: int
-    input_type: str = "holding"  # "holding" | "input"
-    data_type: str = "int16"     # "int16" | "uint16" | "uint32"
-    scale: float = 1.0
-    offset: float = 0.0
-    precision: int | None = None
-    unit: str | None = None
-    device_class: str | None = None
-    state_class: str | None = None
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+from ._common import RegisterDef
+
+
+# Derived text keys per raw code, built once rather than on every compute_derived call
+_IAQ_LEVEL_TEXT: Final[Mapping[int, str]] = MappingProxyType({0: "economy", 1: "good", 2: "improve"})
+
+# Filter status and remaining-time bucket keys, indexed by the codes from _filter_codes()
+_FILTER_STATUS_KEYS: Final[tuple[str, ...]] = ("unknown", "replace_filter", "warning", "ok")
+_FILTER_BUCKET_KEYS: Final[tuple[str, ...]] = ("unknown", "more_than_18_months", "months", "days")
+# Legacy text per status code; "ok" (3) is spelled out from the bucket instead
+_FILTER_STATUS_TEXT: Final[tuple[str, ...]] = ("Unknown", "Replace filter!", "Filter warning")
+
+# Legacy "next_filter_change" texts for every reachable count: the "days" bucket covers
+# 0-30 days and the "months" bucket 31-548 days, i.e. 1-18 months.
+_DAYS_TEXT: Final[tuple[str, ...]] = tuple(f"{i} days" for i in range(31))
+_MONTHS_TEXT: Final[tuple[str, ...]] = tuple(f"{i} months" for i in range(19))
+
+
+def _filter_codes(alarm: int, warning: int, seconds: int, days: int) -> tuple[int, int]:
+    """Classify the filter state as (status, bucket) codes.
+
+    The remaining time is unknown unless seconds > 0. Alarm and warning take
+    precedence for the status; the bucket only depends on the time left.
+    """
+    if seconds <= 0:
+        bucket = 0
+    elif days > 548:
+        bucket = 1
+    elif days >= 31:
+        bucket = 2
+    else:
+        bucket = 3
+    if alarm == 1:
+        return 1, bucket
+    if warning == 1:
+        return 2, bucket
+    return (3 if bucket else 0), bucket
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    """Truncate a raw value to int, or return default if it isn't numeric."""
+    # Decoded register values are floats; take that path without building a new float.
+    t = type(value)
+    if t is float:
+        return int(value) if value == value else default  # NaN -> default
+    if t is int:
+        return value
+    if value is None:
+        return default
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
 
 
 class SaveModel:
@@ -34,11 +75,12 @@ class SaveModel:
         If not provided, we fall back to the legacy factor (fan % * 3).
         """
         self._qv_max = qv_max
-
-    @property
-    def flow_factor(self) -> float:
-        """m³/h per % (estimated)."""
-        return (self._qv_max / 100.0) if self._qv_max else 3.0
+        # m³/h per % (estimated); fixed for the lifetime of the model
+        self.flow_factor: float = (qv_max / 100.0) if qv_max else 3.0
+        # Last (inputs, derived values) from compute_derived; most polls change none of the inputs
+        self._derived_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+        # Result when none of the inputs were read (skipped/failed poll), built once
+        self._empty_derived: dict[str, Any] = self._compute_derived(self._NO_DERIVED_INPUTS)
 
     ADDR_MODE_STATUS = 1160
     ADDR_MODE_COMMAND = 1161
@@ -69,7 +111,8 @@ class SaveModel:
     # NOTE: Keep all user-facing labels in English in code.
     # The HA frontend can translate *states* (for derived sensors) via translations,
     # but things like climate preset labels are not auto-translated.
-    COMMAND_MODE_OPTIONS: dict[str, int] = {
+    # Lookup tables are read-only views so a caller can't change them for every entity.
+    COMMAND_MODE_OPTIONS: Mapping[str, int] = MappingProxyType({
         "Auto": 1,
         "Manual": 2,
         "Party": 3,
@@ -77,9 +120,9 @@ class SaveModel:
         "Fireplace": 5,
         "Away": 6,
         "Holiday": 7,
-    }
+    })
 
-    STATUS_MODE_TO_LABEL: dict[int, str] = {
+    STATUS_MODE_TO_LABEL: Mapping[int, str] = MappingProxyType({
         0: "Auto",
         1: "Manual",
         2: "Party",
@@ -93,42 +136,53 @@ class SaveModel:
         10: "CDI2",
         11: "CDI3",
         12: "Pressure guard",
-    }
-
-    # Language-neutral keys for derived sensors (translated in UI)
-    STATUS_MODE_TO_KEY: dict[int, str] = {
-        0: "auto",
-        1: "manual",
-        2: "party",
-        3: "boost",
-        4: "fireplace",
-        5: "away",
-        6: "holiday",
-        7: "cooker_hood",
-        8: "vacuum_cleaner",
-        9: "cdi1",
-        10: "cdi2",
-        11: "cdi3",
-        12: "pressure_guard",
-    }
-
-    MANUAL_SPEED_OPTIONS: dict[str, int] = {
+    })
+
+    # Language-neutral keys for derived sensors (translated in UI), indexed by the
+    # (dense, 0-based) mode status code.
+    _STATUS_KEYS: tuple[str, ...] = (
+        "auto",
+        "manual",
+        "party",
+        "boost",
+        "fireplace",
+        "away",
+        "holiday",
+        "cooker_hood",
+        "vacuum_cleaner",
+        "cdi1",
+        "cdi2",
+        "cdi3",
+        "pressure_guard",
+    )
+    STATUS_MODE_TO_KEY: Mapping[int, str] = MappingProxyType(dict(enumerate(_STATUS_KEYS)))
+
+    # Manual mode status keys, indexed by the manual speed command (1 is not a speed)
+    _MANUAL_STATUS_KEYS: tuple[str, ...] = (
+        "manual_stop",
+        "manual_unknown",
+        "manual_low",
+        "manual_normal",
+        "manual_high",
+    )
+
+    MANUAL_SPEED_OPTIONS: Mapping[str, int] = MappingProxyType({
         "Stop": 0,
         "Low": 2,
         "Normal": 3,
         "High": 4,
-    }
-    MANUAL_SPEED_OPTIONS_INV: dict[int, str] = {v: k for k, v in MANUAL_SPEED_OPTIONS.items()}
+    })
+    MANUAL_SPEED_OPTIONS_INV: Mapping[int, str] = MappingProxyType({v: k for k, v in MANUAL_SPEED_OPTIONS.items()})
 
     # Free cooling minimum fan speed uses the same discrete speed steps as manual speed.
-    FREE_COOLING_MIN_SPEED_OPTIONS: dict[str, int] = MANUAL_SPEED_OPTIONS
-    FREE_COOLING_MIN_SPEED_OPTIONS_INV: dict[int, str] = {v: k for k, v in FREE_COOLING_MIN_SPEED_OPTIONS.items()}
+    FREE_COOLING_MIN_SPEED_OPTIONS: Mapping[str, int] = MANUAL_SPEED_OPTIONS
+    FREE_COOLING_MIN_SPEED_OPTIONS_INV: Mapping[int, str] = MANUAL_SPEED_OPTIONS_INV
 
     # Backwards-compatible aliases (older code used these names).
     MODE_COMMAND_OPTIONS = COMMAND_MODE_OPTIONS
     MODE_STATUS_TO_LABEL = STATUS_MODE_TO_LABEL
 
-    REGISTERS: list[RegisterDef] = [
+    REGISTERS: tuple[RegisterDef, ...] = (
         # --- Modes and time settings ---
         RegisterDef(key='summer_winter_operation_1_0', address=1038, input_type='input', data_type='uint16'),
         RegisterDef(key='holiday_mode_duration', address=1100, input_type='holding', data_type='uint16', unit='days'),
@@ -243,8 +297,22 @@ class SaveModel:
         RegisterDef(key='a_alarm', address=15900, input_type='input', data_type='uint16'),
         RegisterDef(key='b_alarm', address=15901, input_type='input', data_type='uint16'),
         RegisterDef(key='c_alarm', address=15902, input_type='input', data_type='uint16'),
-    ]
-
+    )
+
+    # Every raw value compute_derived reads; the result depends on nothing else.
+    _DERIVED_INPUT_KEYS: tuple[str, ...] = (
+        "time_to_filter_replacement",
+        "filter_alarm",
+        "filter_warning_alarm",
+        "summer_winter_operation_1_0",
+        "iaq_level",
+        "supply_air_room_exhaust_reg",
+        "mode_status_register",
+        "manual_mode_command_register",
+        "extractor_fan_pwr_fact",
+        "supply_air_fan_pwr_fact",
+    )
+    _NO_DERIVED_INPUTS: tuple[None, ...] = (None,) * len(_DERIVED_INPUT_KEYS)
 
     def compute_derived(self, data: dict[str, Any]) -> dict[str, Any]:
         """Compute derived values from raw register data.
@@ -252,22 +320,51 @@ class SaveModel:
         Notes:
         - Keep user-facing text OUT of the model.
         - For UI, prefer language-neutral keys + numeric values.
+        - The result is reused while none of _DERIVED_INPUT_KEYS change.
         """
-
-        def _to_int(value: Any, default: int = 0) -> int:
-            try:
-                return int(float(value))
-            except (TypeError, ValueError):
-                return default
-
+        fingerprint = tuple(data.get(k) for k in self._DERIVED_INPUT_KEYS)
+        if fingerprint == self._NO_DERIVED_INPUTS:
+            # Don't let an empty poll evict the last real result from the cache.
+            return self._empty_derived.copy()
+        cached = self._derived_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1].copy()
+
+        out = self._compute_derived(fingerprint)
+        self._derived_cache = (fingerprint, out)
+        return out.copy()
+
+    @staticmethod
+    def _flow_rates(p_e: int, p_s: int, factor: float) -> tuple[int, int]:
+        """Estimated (exhaust, supply) air flow in m³/h from the fan power factors (%).
+
+        Rounds halves up (2.5 -> 3), not to even like round(); the power factors are
+        never negative.
+        """
+        return int(p_e * factor + 0.5), int(p_s * factor + 0.5)
+
+    def _compute_derived(self, raw: tuple[Any, ...]) -> dict[str, Any]:
+        """Compute derived values from the raw inputs, in _DERIVED_INPUT_KEYS order."""
+        (
+            seconds_raw,
+            alarm_raw,
+            warning_raw,
+            season_raw,
+            iaq_raw,
+            reg_mode_raw,
+            mode_raw,
+            man_raw,
+            p_e_raw,
+            p_s_raw,
+        ) = raw
         out: dict[str, Any] = {}
 
         # ------------------------------------------------------------
         # Filter status / remaining time
         # ------------------------------------------------------------
-        seconds = _to_int(data.get("time_to_filter_replacement"), 0)
-        alarm = _to_int(data.get("filter_alarm"), 0)
-        warning = _to_int(data.get("filter_warning_alarm"), 0)
+        seconds = _to_int(seconds_raw, 0)
+        alarm = _to_int(alarm_raw, 0)
+        warning = _to_int(warning_raw, 0)
 
         # ALWAYS define these to avoid UnboundLocalError
         days = 0
@@ -280,57 +377,37 @@ class SaveModel:
         out["filter_time_remaining_days"] = int(days)
         out["filter_time_remaining_months"] = int(months)
 
-        if alarm == 1:
-            out["next_filter_change_status"] = "replace_filter"
-        elif warning == 1:
-            out["next_filter_change_status"] = "warning"
-        elif seconds <= 0:
-            out["next_filter_change_status"] = "unknown"
-        else:
-            out["next_filter_change_status"] = "ok"
-
-        if seconds <= 0:
-            out["next_filter_change_bucket"] = "unknown"
-        else:
-            if days > 548:
-                out["next_filter_change_bucket"] = "more_than_18_months"
-            elif days >= 31:
-                out["next_filter_change_bucket"] = "months"
-            else:
-                out["next_filter_change_bucket"] = "days"
+        status, bucket = _filter_codes(alarm, warning, seconds, days)
+        out["next_filter_change_status"] = _FILTER_STATUS_KEYS[status]
+        out["next_filter_change_bucket"] = _FILTER_BUCKET_KEYS[bucket]
 
         # Backwards-compatible legacy text for existing sensor "next_filter_change".
         # Keep in English to avoid hardcoded Norwegian in code.
-        if alarm == 1:
-            out["next_filter_change"] = "Replace filter!"
-        elif warning == 1:
-            out["next_filter_change"] = "Filter warning"
-        elif seconds <= 0:
-            out["next_filter_change"] = "Unknown"
+        if status != 3:
+            out["next_filter_change"] = _FILTER_STATUS_TEXT[status]
+        elif bucket == 1:
+            out["next_filter_change"] = "More than 18 months"
+        elif bucket == 2:
+            out["next_filter_change"] = _MONTHS_TEXT[months]
         else:
-            if days > 548:
-                out["next_filter_change"] = "More than 18 months"
-            elif days >= 31:
-                out["next_filter_change"] = f"{months} months"
-            else:
-                out["next_filter_change"] = f"{days} days"
+            out["next_filter_change"] = _DAYS_TEXT[days]
 
         # ------------------------------------------------------------
         # Season
         # ------------------------------------------------------------
-        season = _to_int(data.get("summer_winter_operation_1_0"), -1)
+        season = _to_int(season_raw, -1)
         out["active_season"] = "summer" if season == 0 else "winter" if season == 1 else "unknown"
 
         # ------------------------------------------------------------
         # IAQ level text
         # ------------------------------------------------------------
-        v = _to_int(data.get("iaq_level"), -1)
-        out["iaq_level_text"] = {0: "economy", 1: "good", 2: "improve"}.get(v, "unknown")
+        v = _to_int(iaq_raw, -1)
+        out["iaq_level_text"] = _IAQ_LEVEL_TEXT.get(v, "unknown")
 
         # ------------------------------------------------------------
         # Regulation mode text
         # ------------------------------------------------------------
-        reg_mode = _to_int(data.get("supply_air_room_exhaust_reg"), -1)
+        reg_mode = _to_int(reg_mode_raw, -1)
         if reg_mode == 0:
             out["regulation_mode_text"] = "supply_air"
         elif reg_mode == 1:
@@ -343,28 +420,24 @@ class SaveModel:
         # ------------------------------------------------------------
         # Mode status text (language-neutral keys)
         # ------------------------------------------------------------
-        mode = _to_int(data.get("mode_status_register"), -1)
-        man = _to_int(data.get("manual_mode_command_register"), -1)
+        mode = _to_int(mode_raw, -1)
+        man = _to_int(man_raw, -1)
 
         if mode == 0:
             out["mode_status_text"] = "auto_demand_control"
         elif mode == 1:
-            out["mode_status_text"] = {
-                0: "manual_stop",
-                2: "manual_low",
-                3: "manual_normal",
-                4: "manual_high",
-            }.get(man, "manual_unknown")
+            keys = self._MANUAL_STATUS_KEYS
+            out["mode_status_text"] = keys[man] if 0 <= man < len(keys) else "manual_unknown"
         else:
-            out["mode_status_text"] = SaveModel.STATUS_MODE_TO_KEY.get(mode, "unknown")
+            keys = self._STATUS_KEYS
+            out["mode_status_text"] = keys[mode] if 0 <= mode < len(keys) else "unknown"
 
         # ------------------------------------------------------------
         # Estimated flow rates (m³/h)
         # ------------------------------------------------------------
-        p_e = _to_int(data.get("extractor_fan_pwr_fact"), 0)
-        p_s = _to_int(data.get("supply_air_fan_pwr_fact"), 0)
+        p_e = _to_int(p_e_raw, 0)
+        p_s = _to_int(p_s_raw, 0)
 
-        out["exhaust_air_flow_rate"] = round(p_e * self.flow_factor)
-        out["supply_air_flow_rate"] = round(p_s * self.flow_factor)
+        out["exhaust_air_flow_rate"], out["supply_air_flow_rate"] = self._flow_rates(p_e, p_s, self.flow_factor)
 
         return out
\ No newline at end of file
@@ -1,15 +1,20 @@
 """Sensor platform for Systemair Modbus."""
 from __future__ import annotations
 
-import re
+from collections.abc import Mapping
+from functools import lru_cache
+import string
+from types import MappingProxyType
+from typing import NamedTuple
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
+from .const import CONF_INCLUDE_DIAGNOSTIC, DEFAULT_INCLUDE_DIAGNOSTIC, DOMAIN
 from .entity import SystemairBaseEntity
 
 
@@ -22,130 +27,173 @@ _STRIP_PREFIXES: tuple[str, ...] = (
 )
 
 
+class _ObjectIdTable(dict):
+    """Translate table keeping [a-z0-9_] and marking every other character with NUL.
+
+    Covers non-ASCII characters too (æ/ø/å, °, ...), like the regex it replaces.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        return "\0"
+
+
+# Every character outside [a-z0-9_] is marked with NUL for _suggested_object_id to replace.
+_OBJECT_ID_TABLE = _ObjectIdTable(
+    (ord(c), c) for c in string.ascii_lowercase + string.digits + "_"
+)
+
+
+# Fallback English names: direct mappings for the most-used/most-visible values.
+# The name maps are shared by every entry, so they are exposed read-only.
+_DIRECT_NAMES: Mapping[str, str] = MappingProxyType({
+    "outdoor_temperature": "Outdoor temperature",
+    "supply_temperature": "Supply air temperature",
+    "extract_temperature": "Extract air temperature",
+    "room_temperature": "Room temperature",
+    "free_cooling_enable": "Free cooling active",
+    "eco_mode_enable": "Eco mode active",
+    "heat_recovery": "Heat recovery",
+    "filter_alarm": "Filter alarm",
+    "filter_warning_alarm": "Filter warning",
+    "calculated_moisture_extraction": "Calculated moisture extraction",
+    "calculated_moisture_intake": "Calculated moisture intake",
+
+    # Duration / timers
+    "refresh_mode_duration": "Refresh mode – duration",
+    "fireplace_mode_duration": "Fireplace mode – duration",
+    "holiday_mode_duration": "Holiday mode – duration",
+    "away_mode_duration": "Away mode – duration",
+    "crowded_mode_duration": "Crowded mode – duration",
+
+    # Free cooling (night cooling)
+    "free_cooling_active": "Free cooling active",
+    "free_cooling_daytime_min_temp": "Free cooling – daytime min temp",
+    "free_cooling_night_high_limit": "Free cooling – night high limit",
+    "free_cooling_night_low_limit": "Free cooling – night low limit",
+    "free_cooling_room_cancel_temp": "Free cooling – room cancel temp",
+    "free_cooling_start_time_h": "Free cooling – start (hour)",
+    "free_cooling_start_time_m": "Free cooling – start (minute)",
+    "free_cooling_end_time_h": "Free cooling – end (hour)",
+    "free_cooling_end_time_m": "Free cooling – end (minute)",
+    "free_cooling_min_speed_saf": "Free cooling – min SAF speed",
+    "free_cooling_min_speed_eaf": "Free cooling – min EAF speed",
+
+    # Filters
+    "filter_replacement_alarm": "Filter replacement alarm",
+    "filter_replacement_period": "Filter replacement interval",
+    "filter_warning_alarm": "Filter warning",
+    "filter_warning_alarm_delay_count": "Filter warning – delay",
+
+    # Speeds (common)
+    "saf_speed_rpm": "SAF fan speed (RPM)",
+    "eaf_speed_rpm": "EAF fan speed (RPM)",
+
+    # Season / operation
+    "summer_winter_operation_1_0": "Summer/winter operation",
+})
+
+# Fan named by the leading part of a generated name
+_FAN_NAMES: Mapping[str, str] = MappingProxyType({"saf": "Supply air fan", "eaf": "Extract air fan"})
+
+# Word replacements for generated names
+_NAME_WORDS: Mapping[str, str] = MappingProxyType({
+    "speed": "speed",
+    "temperature": "temperature",
+    "high": "high",
+    "low": "low",
+    "enable": "enabled",
+    "enabled": "enabled",
+    "status": "status",
+    "alarm": "alarm",
+    "pressure": "pressure",
+    "humidity": "humidity",
+    "timer": "timer",
+    "time": "time",
+    "remaining": "remaining",
+})
+
+
+# The naming helpers below are pure functions of a register key, and the set of keys is
+# small and fixed; cache them so config entry reloads don't redo the string work.
+@lru_cache(maxsize=None)
 def _strip_prefixes(key: str) -> str:
     """Strip known prefixes from a key and return the remainder."""
     s = key.strip()
+    # One C-level check covers the common case (no known prefix at all). Otherwise only
+    # the first matching prefix is removed, so chained removeprefix() would not be equivalent.
+    if not s.startswith(_STRIP_PREFIXES):
+        return s
     for prefix in _STRIP_PREFIXES:
         if s.startswith(prefix):
-            return s[len(prefix) :]
+            return s.removeprefix(prefix)
     return s
 
 
+@lru_cache(maxsize=None)
 def _pretty_reg_name(key: str) -> str:
     """Make register keys human-friendly (English fallback labels)."""
-    base = _strip_prefixes(key).lower().strip("_")
-
-    # Direct mappings for the most-used/most-visible values
-    direct = {
-        "outdoor_temperature": "Outdoor temperature",
-        "supply_temperature": "Supply air temperature",
-        "extract_temperature": "Extract air temperature",
-        "room_temperature": "Room temperature",
-        "free_cooling_enable": "Free cooling active",
-        "eco_mode_enable": "Eco mode active",
-        "heat_recovery": "Heat recovery",
-        "filter_alarm": "Filter alarm",
-        "filter_warning_alarm": "Filter warning",
-        "calculated_moisture_extraction": "Calculated moisture extraction",
-        "calculated_moisture_intake": "Calculated moisture intake",
-
-        # Duration / timers
-        "refresh_mode_duration": "Refresh mode – duration",
-        "fireplace_mode_duration": "Fireplace mode – duration",
-        "holiday_mode_duration": "Holiday mode – duration",
-        "away_mode_duration": "Away mode – duration",
-        "crowded_mode_duration": "Crowded mode – duration",
-
-        # Free cooling (night cooling)
-        "free_cooling_active": "Free cooling active",
-        "free_cooling_daytime_min_temp": "Free cooling – daytime min temp",
-        "free_cooling_night_high_limit": "Free cooling – night high limit",
-        "free_cooling_night_low_limit": "Free cooling – night low limit",
-        "free_cooling_room_cancel_temp": "Free cooling – room cancel temp",
-        "free_cooling_start_time_h": "Free cooling – start (hour)",
-        "free_cooling_start_time_m": "Free cooling – start (minute)",
-        "free_cooling_end_time_h": "Free cooling – end (hour)",
-        "free_cooling_end_time_m": "Free cooling – end (minute)",
-        "free_cooling_min_speed_saf": "Free cooling – min SAF speed",
-        "free_cooling_min_speed_eaf": "Free cooling – min EAF speed",
-
-        # Filters
-        "filter_replacement_alarm": "Filter replacement alarm",
-        "filter_replacement_period": "Filter replacement interval",
-        "filter_warning_alarm": "Filter warning",
-        "filter_warning_alarm_delay_count": "Filter warning – delay",
-
-        # Speeds (common)
-        "saf_speed_rpm": "SAF fan speed (RPM)",
-        "eaf_speed_rpm": "EAF fan speed (RPM)",
-
-        # Season / operation
-        "summer_winter_operation_1_0": "Summer/winter operation",
-    }
-    if base in direct:
-        return direct[base]
-
-    parts = [p for p in base.split("_") if p]
+    return _pretty_reg_name_from_base(_base_key(key))
+
 
+@lru_cache(maxsize=None)
+def _pretty_reg_name_from_base(base: str) -> str:
+    """Like _pretty_reg_name, for a key already normalized with _base_key."""
+    if base in _DIRECT_NAMES:
+        return _DIRECT_NAMES[base]
+
+    # One pass over the key's parts: a leading saf/eaf names the fan, "rpm" becomes a
+    # suffix, everything else is translated into the phrase.
     fan = None
-    if parts and parts[0] in ("saf", "eaf"):
-        fan = "Supply air fan" if parts[0] == "saf" else "Extract air fan"
-        parts = parts[1:]
-
-    rpm = "rpm" in parts
-    parts = [p for p in parts if p != "rpm"]
-
-    trans = {
-        "speed": "speed",
-        "temperature": "temperature",
-        "high": "high",
-        "low": "low",
-        "enable": "enabled",
-        "enabled": "enabled",
-        "status": "status",
-        "alarm": "alarm",
-        "pressure": "pressure",
-        "humidity": "humidity",
-        "timer": "timer",
-        "time": "time",
-        "remaining": "remaining",
-    }
-
-    words = [trans.get(p, p) for p in parts]
+    rpm = False
+    words: list[str] = []
+    for p in base.split("_"):
+        if not p:
+            continue
+        if fan is None and not words and not rpm and p in _FAN_NAMES:
+            fan = _FAN_NAMES[p]
+        elif p == "rpm":
+            rpm = True
+        else:
+            words.append(_NAME_WORDS.get(p, p))
+    phrase = " ".join(words)
 
     # Fan-friendly formatting
     if fan:
-        phrase = " ".join(words).strip()
         if rpm:
             phrase = (phrase + " (RPM)").strip()
         return f"{fan} – {phrase}" if phrase else fan
 
     # Generic fallback
-    phrase = " ".join(words).strip()
     if rpm:
         phrase = (phrase + " (RPM)").strip()
     return phrase[:1].upper() + phrase[1:] if phrase else base
 
 
+@lru_cache(maxsize=None)
 def _suggested_object_id(key: str) -> str:
     """Generate a short, stable object_id (used for entity_id on first create)."""
-    s = _strip_prefixes(key).lower()
-    s = re.sub(r"[^a-z0-9_]+", "_", s).strip("_")
+    s = _base_key(key).translate(_OBJECT_ID_TABLE)
+    # Each run of disallowed characters becomes a single "_"
+    s = "_".join(filter(None, s.split("\0"))).strip("_")
     if not s:
         s = "value"
     # Always prefix with save_ for a consistent namespace in entity_id
     return f"save_{s}"
 
 
+@lru_cache(maxsize=None)
 def _base_key(key: str) -> str:
-    """Normalize a register key to its logical base (no device/model prefixes)."""
+    """Normalize a register key to its logical base (no device/model prefixes).
+
+    The one canonical form used by every naming helper (names, object ids, enabled set).
+    """
     return _strip_prefixes(key).lower().strip("_")
 
 
 # Raw register sensors: keep only the most useful enabled by default.
 # Everything else is still available, but hidden by default to reduce noise in the UI.
 
-ENABLED_RAW_KEYS: set[str] = {
+ENABLED_RAW_KEYS: frozenset[str] = frozenset({
     # Temperatures
     "outdoor_temperature",
     "supply_temperature",
@@ -161,17 +209,24 @@ ENABLED_RAW_KEYS: set[str] = {
     "relative_moisture_extraction",
     # Heat recovery
     "heat_recovery",
-}
+})
+
+
+class DerivedDef(NamedTuple):
+    key: str
+    icon: str | None = None
+    unit: str | None = None
 
-DERIVED = [
-    {"key": "mode_status_text", "icon": "mdi:fan"},
-    {"key": "active_season", "icon": "mdi:weather-sunny-snowflake"},
-    {"key": "next_filter_change", "icon": "mdi:air-filter"},
-    {"key": "iaq_level_text", "icon": "mdi:air-filter"},
-    {"key": "regulation_mode_text", "icon": "mdi:tune-vertical"},
-    {"key": "exhaust_air_flow_rate", "icon": "mdi:weather-windy", "unit": "m³/h"},
-    {"key": "supply_air_flow_rate", "icon": "mdi:weather-windy", "unit": "m³/h"},
-]
+
+DERIVED: tuple[DerivedDef, ...] = (
+    DerivedDef("mode_status_text", "mdi:fan"),
+    DerivedDef("active_season", "mdi:weather-sunny-snowflake"),
+    DerivedDef("next_filter_change", "mdi:air-filter"),
+    DerivedDef("iaq_level_text", "mdi:air-filter"),
+    DerivedDef("regulation_mode_text", "mdi:tune-vertical"),
+    DerivedDef("exhaust_air_flow_rate", "mdi:weather-windy", "m³/h"),
+    DerivedDef("supply_air_flow_rate", "mdi:weather-windy", "m³/h"),
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -179,15 +234,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coordinator = data["coordinator"]
     model = coordinator.model
 
-    entities: list[SensorEntity] = []
-
-    # Raw register-backed sensors (1:1 from the known working register map)
-    for reg in model.REGISTERS:
-        entities.append(SystemairRegisterSensor(coordinator, entry, reg))
+    # Raw register-backed sensors (1:1 from the known working register map). The hidden
+    # diagnostic ones can be left out entirely, so they don't take part in updates at all.
+    include_diagnostic = entry.options.get(CONF_INCLUDE_DIAGNOSTIC, DEFAULT_INCLUDE_DIAGNOSTIC)
+    if include_diagnostic:
+        entities: list[SensorEntity] = [
+            SystemairRegisterSensor(coordinator, entry, reg) for reg in model.REGISTERS
+        ]
+    else:
+        entities = []
+        registry = er.async_get(hass)
+        for reg in model.REGISTERS:
+            if _base_key(reg.key) in ENABLED_RAW_KEYS:
+                entities.append(SystemairRegisterSensor(coordinator, entry, reg))
+                continue
+            # Only skip the ones that are disabled; a diagnostic sensor the user enabled is
+            # still built. Registry entries are left alone so the user's settings survive.
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_reg_{reg.key}")
+            reg_entry = registry.async_get(entity_id) if entity_id is not None else None
+            if reg_entry is not None and not reg_entry.disabled:
+                entities.append(SystemairRegisterSensor(coordinator, entry, reg))
 
     # Derived sensors
-    for d in DERIVED:
-        entities.append(SystemairDerivedSensor(coordinator, entry, d["key"], d.get("icon"), d.get("unit")))
+    entities.extend(SystemairDerivedSensor(coordinator, entry, d.key, d.icon, d.unit) for d in DERIVED)
 
     # Calculated (estimated) exhaust/avkast temperature (NOT a real Modbus sensor)
     entities.append(SystemairCalculatedExhaustTemperature(coordinator, entry))
@@ -208,10 +277,8 @@ class SystemairRegisterSensor(SystemairBaseEntity, SensorEntity):
         if base_key in ENABLED_RAW_KEYS:
             self._attr_translation_key = base_key
         else:
-            self._attr_name = _pretty_reg_name(reg.key)
-
-        # Hide most raw registers by default (they are still available in the entity registry).
-        if base_key not in ENABLED_RAW_KEYS:
+            self._attr_name = _pretty_reg_name_from_base(base_key)
+            # Hide most raw registers by default (they are still available in the entity registry).
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
             self._attr_entity_registry_enabled_default = False
 
@@ -258,34 +325,39 @@ class SystemairCalculatedExhaustTemperature(SystemairBaseEntity, SensorEntity):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_entity_category = None
     _attr_entity_registry_enabled_default = True
+    _attr_suggested_object_id = _suggested_object_id("calculated_exhaust_temperature")
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(entry, coordinator)
         self._attr_unique_id = f"{entry.entry_id}_calculated_exhaust_temperature"
-        self._attr_suggested_object_id = _suggested_object_id("calculated_exhaust_temperature")
 
     @property
     def native_value(self):
-        t_out = self.coordinator.data.get("outdoor_temperature")
-        t_ext = self.coordinator.data.get("extract_temperature")
-        hr_pct = self.coordinator.data.get("heat_recovery")  # 0..100 (pådrag/aktivitet)
+        data = self.coordinator.data
+        t_out = data.get("outdoor_temperature")
+        t_ext = data.get("extract_temperature")
+        hr_pct = data.get("heat_recovery")  # 0..100 (pådrag/aktivitet)
+        if t_out is None or t_ext is None or hr_pct is None:
+            return None
 
         try:
-            if t_out is None or t_ext is None or hr_pct is None:
-                return None
-
             t_out = float(t_out)
             t_ext = float(t_ext)
-
-            # Skaler "pådrag" til estimert reell virkningsgrad (maks 82 %)
-            eta = 0.82 * (float(hr_pct) / 100.0)
-
-            # clamp 0..0.82
-            eta = max(0.0, min(0.82, eta))
-
-            # T_exhaust ≈ T_extract - eta * (T_extract - T_outdoor)
-            t_exhaust = t_ext - eta * (t_ext - t_out)
-            return round(t_exhaust, 1)
-
+            hr_pct = float(hr_pct)
         except (TypeError, ValueError):
-            return None
\ No newline at end of file
+            return None
+
+        # Skaler "pådrag" til estimert reell virkningsgrad (maks 82 %): 0.82 * hr_pct / 100
+        eta = 0.0082 * hr_pct
+
+        # clamp 0..0.82
+        if eta < 0.0:
+            eta = 0.0
+        elif eta > 0.82:
+            eta = 0.82
+
+        # T_exhaust ≈ T_extract - eta * (T_extract - T_outdoor)
+        t_exhaust = t_ext - eta * (t_ext - t_out)
+        # One decimal, halves rounded away from zero (display value; no need for round()'s
+        # correctly-rounded decimal path)
+        return int(t_exhaust * 10 + (0.5 if t_exhaust >= 0 else -0.5)) / 10
@@ -0,0 +1,75 @@
+"""Tests for the Modbus client read path (gateway replaced by an in-memory fake)."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.systemair_modbus import modbus
+from custom_components.systemair_modbus.models._common import RegisterDef
+
+
+class _Response:
+    def __init__(self, registers=None, exception_code=None) -> None:
+        self.registers = registers or []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802 (pymodbus API)
+        return self.exception_code is not None
+
+
+class _FakeGateway:
+    """Answers FC03 for any address, FC04 only for the addresses in `defined`."""
+
+    def __init__(self, defined: set[int]) -> None:
+        self.defined = defined
+        self.connected = False
+        self.calls: list[tuple[int, int, int]] = []
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_holding_registers(self, address, *, count=1, device_id=1):
+        self.calls.append((3, address, count))
+        return _Response([address + i for i in range(count)])
+
+    async def read_input_registers(self, address, *, count=1, device_id=1):
+        self.calls.append((4, address, count))
+        if any(a not in self.defined for a in range(address, address + count)):
+            return _Response(exception_code=modbus.EXC_ILLEGAL_DATA_ADDRESS)
+        return _Response([address + i for i in range(count)])
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    gw = _FakeGateway(defined={100, 101, 104})
+    monkeypatch.setattr(modbus, "AsyncModbusTcpClient", lambda *args, **kwargs: gw)
+    return gw
+
+
+def test_bridged_fc04_read_rejected_as_illegal_address_is_split_not_fc03(gateway):
+    """A bridged FC04 range rejected with code 2 is split; it must not switch to FC03."""
+    persisted: list[bool] = []
+    client = modbus.ModbusTcpClient(
+        host="gw",
+        port=502,
+        slave=1,
+        on_input_as_holding=lambda: persisted.append(True),
+    )
+    register_defs = (
+        RegisterDef(key="a", address=100, input_type="input", data_type="uint16"),
+        RegisterDef(key="b", address=101, input_type="input", data_type="uint16"),
+        RegisterDef(key="c", address=104, input_type="input", data_type="uint16"),
+    )
+
+    result = asyncio.run(client.read_register_map(register_defs))
+
+    assert result == {"a": 100.0, "b": 101.0, "c": 104.0}
+    assert gateway.calls[0] == (4, 100, 5)  # bridged read over the 102-103 hole
+    assert all(fc == 4 for fc, _, _ in gateway.calls)
+    assert client._force_input_as_holding is False
+    assert persisted == []
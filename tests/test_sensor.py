@@ -0,0 +1,56 @@
+"""Tests for the sensor platform."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.systemair_modbus import sensor
+from custom_components.systemair_modbus.const import CONF_INCLUDE_DIAGNOSTIC, DOMAIN
+from custom_components.systemair_modbus.models._common import RegisterDef
+
+
+def test_suggested_object_id_replaces_non_ascii_characters():
+    """Norwegian letters and symbols become "_" like any other character outside [a-z0-9_]."""
+    sensor._suggested_object_id.cache_clear()
+
+    assert sensor._suggested_object_id("Utetemperatur_°C") == "save_utetemperatur__c"
+    assert sensor._suggested_object_id("Ærlig_øst_på_gården") == "save_rlig__st_p__g_rden"
+    assert sensor._suggested_object_id("save_ø") == "save_value"
+
+
+class _FakeRegistry:
+    """Entity registry holding `unique_id -> disabled` entries."""
+
+    def __init__(self, entries: dict[str, bool]) -> None:
+        self.entries = entries
+        self.removed: list[str] = []
+
+    def async_get_entity_id(self, domain, platform, unique_id):
+        return f"sensor.{unique_id}" if unique_id in self.entries else None
+
+    def async_get(self, entity_id):
+        return SimpleNamespace(disabled=self.entries[entity_id.removeprefix("sensor.")])
+
+    def async_remove(self, entity_id) -> None:
+        self.removed.append(entity_id)
+
+
+def test_include_diagnostic_off_keeps_user_enabled_diagnostic_sensor(monkeypatch):
+    """With the option off, disabled diagnostic sensors are skipped and the registry is left alone."""
+    entry = SimpleNamespace(entry_id="e1", title="SAVE", options={CONF_INCLUDE_DIAGNOSTIC: False})
+    registry = _FakeRegistry({"e1_reg_diag_enabled": False, "e1_reg_diag_disabled": True})
+    monkeypatch.setattr(sensor.er, "async_get", lambda hass: registry)
+    coordinator = MagicMock()
+    coordinator.model.REGISTERS = tuple(
+        RegisterDef(key=key, address=address, input_type="holding", data_type="uint16")
+        for address, key in enumerate(("outdoor_temperature", "diag_enabled", "diag_disabled", "diag_new"))
+    )
+    hass = SimpleNamespace(data={DOMAIN: {"e1": {"coordinator": coordinator}}})
+    added: list = []
+
+    asyncio.run(sensor.async_setup_entry(hass, entry, added.extend))
+
+    register_keys = {e._key for e in added if isinstance(e, sensor.SystemairRegisterSensor)}
+    assert register_keys == {"outdoor_temperature", "diag_enabled"}
+    assert registry.removed == []